@@ -2,7 +2,7 @@ import logging
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import JobApplication
-from embeddings.tasks import compute_job_match_task
+from embeddings.tasks import compute_job_match_task, schedule_application_insight
 from django.db import transaction
 
 from notifications.services import create_notification
@@ -20,6 +20,14 @@ def trigger_match_score(sender, instance, created, **kwargs):
         )
 
 
+@receiver(post_save, sender=JobApplication)
+def trigger_application_insight(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(
+            lambda: schedule_application_insight(instance.id)
+        )
+
+
 @receiver(post_save, sender=JobApplication)
 def notify_new_application_signal(sender, instance, created, **kwargs):
     if created:
@@ -3,6 +3,7 @@ import json
 
 import cloudinary.uploader as uploader
 
+from django.conf import settings
 from django.db.models import Count, Q
 from django.utils.timezone import now
 from django_filters.rest_framework import DjangoFilterBackend
@@ -14,9 +15,10 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from applications.models import JobApplication, ApplicationInsight
+from applications.models import JobApplication
 from core.permissions import IsJobseeker, IsRecruiter
 from profiles.models import JobSeekerResume
+from embeddings.resume_cache import compute_file_hash
 
 from .filters import JobApplicationFilter
 from .pagination import ApplicationPagination
@@ -32,16 +34,21 @@ from .serializers import (
 logger = logging.getLogger(__name__)
 
 
-from embeddings.services import generate_application_insight
+from embeddings.insights import get_current_insight
+from embeddings.tasks import schedule_application_insight
 
 
 class ApplicationInsightAPIView(APIView):
+    """
+    Returns the application's insight once ready; otherwise queues it
+    and answers 202 "pending" so the client can poll.
+    """
 
     def get(self, request, application_id):
 
         try:
             application = JobApplication.objects.select_related(
-                "job", "applicant"
+                "job", "applicant", "applied_resume"
             ).get(id=application_id)
         except JobApplication.DoesNotExist:
             return Response(
@@ -49,50 +56,34 @@ class ApplicationInsightAPIView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if hasattr(application, "insight"):
-            insight = application.insight
-            return Response({
-                "strengths": insight.strengths,
-                "gaps": insight.gaps,
-                "summary": insight.summary,
-            })
-
         resume = application.applied_resume
 
         if not resume:
             return Response({"error": "No resume linked to application"}, status=400)
 
-        embedding = resume.embedding
+        # Shared with the jobseeker's job insight for the same resume.
+        insight = get_current_insight(application.job, resume)
 
-        if not embedding or not embedding.source_text:
-            return Response({"error": "Resume not processed yet"}, status=400)
-
-        parsed_data = resume.parsed_data  
+        if insight:
+            return Response({
+                "status": "ready",
+                "strengths": insight.strengths,
+                "gaps": insight.gaps,
+                "summary": insight.summary,
+            })
 
-        result = generate_application_insight(
-            application.job,
-            parsed_data
-        )
+        if resume.status == JobSeekerResume.Status.FAILED:
+            return Response({"error": "Resume could not be processed"}, status=400)
 
-        logger.info(f"{result=}")
+        schedule_application_insight(application.id)
 
-        insight, _ = ApplicationInsight.objects.update_or_create(
-            application=application,
-            defaults={
-                "strengths": result.get("strengths", ""),
-                "gaps": result.get("gaps", ""),
-                "summary": result.get("summary", ""),
-            }
+        return Response(
+            {"status": "pending"},
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After": str(settings.INSIGHT_POLL_AFTER)},
         )
 
 
-        return Response({
-            "strengths": insight.strengths,
-            "gaps": insight.gaps,
-            "summary": insight.summary,
-        })
-
-
 class ApplyJobView(APIView):
     permission_classes = [IsJobseeker]
     parser_classes = [MultiPartParser, FormParser]
@@ -133,6 +124,7 @@ class ApplyJobView(APIView):
                     profile=profile,
                     title=resume_file.name,
                     file=resume_file,
+                    file_hash=compute_file_hash(resume_file),
                 )
 
                 uploaded_asset = uploader.upload(
@@ -28,6 +28,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from core.pagination import EstimatedCountPagination
 from core.permissions import IsAdmin, IsJobseeker, IsRecruiter
 
 from .serializers import (
@@ -467,6 +468,7 @@ class GoogleLoginAPIView(APIView):
 class AdminUserListView(ListAPIView):
     permission_classes = [IsAuthenticated, IsAdmin]
     serializer_class = AdminUserListSerializer
+    pagination_class = EstimatedCountPagination
     queryset = USER.objects.all()
 
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
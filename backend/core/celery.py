@@ -1,9 +1,44 @@
 from __future__ import absolute_import, unicode_literals
 import os
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess, start_http_server
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 app = Celery('core')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+# core is not an installed app; its tasks are registered explicitly.
+app.autodiscover_tasks(["core"])
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs):
+    """
+    Serves the worker's Prometheus metrics on CELERY_METRICS_PORT. With
+    PROMETHEUS_MULTIPROC_DIR set, samples from all pool processes are
+    aggregated from that directory.
+    """
+    from django.conf import settings
+
+    if not settings.CELERY_METRICS_PORT:
+        return
+
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    registry = REGISTRY
+
+    if multiproc_dir:
+        # Drop samples left behind by a previous worker run.
+        for name in os.listdir(multiproc_dir):
+            os.remove(os.path.join(multiproc_dir, name))
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
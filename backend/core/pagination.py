@@ -0,0 +1,245 @@
+import hashlib
+import json
+import logging
+from functools import partial
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.paginator import Paginator
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from redis.exceptions import RedisError
+from rest_framework.generics import GenericAPIView
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+COUNT_KEY = "pagination:count:{digest}"
+REFRESH_KEY = "pagination:count:{digest}:refresh"
+
+
+def count_sql(queryset):
+    """
+    SQL and params for COUNT(*) over `queryset`, ordering dropped.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    return f"SELECT COUNT(*) FROM ({sql}) AS subquery", params
+
+
+def planner_estimate(queryset):
+    """
+    Postgres' row estimate for `queryset`: pg_class.reltuples for an
+    unfiltered table, else the top plan node of EXPLAIN. None when the
+    planner has no estimate (table never analyzed).
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0]
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_spec(request, view):
+    """
+    What a worker needs to rebuild the view's filtered queryset: the
+    view's import path, its URL kwargs, the query string and the user.
+    """
+    return {
+        "view": f"{type(view).__module__}.{type(view).__qualname__}",
+        "kwargs": dict(view.kwargs),
+        "query": {key: request.query_params.getlist(key) for key in request.query_params},
+        "user": request.user.pk,
+    }
+
+
+def rebuild_queryset(spec):
+    """
+    The filtered queryset of the list view described by `spec`, built
+    the way the view built it for the original request. Only list views
+    of installed apps paginated with EstimatedCountPagination qualify.
+    """
+    module = spec["view"].rpartition(".")[0]
+    if apps.get_containing_app_config(module) is None:
+        raise ValueError(f"View outside installed apps: {spec['view']}")
+
+    view_class = import_string(spec["view"])
+    if not (
+        isinstance(view_class, type)
+        and issubclass(view_class, GenericAPIView)
+        and issubclass(view_class.pagination_class or object, EstimatedCountPagination)
+    ):
+        raise ValueError(f"Not an estimated-count list view: {spec['view']}")
+
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.GET = QueryDict(mutable=True)
+    for key, values in spec["query"].items():
+        http_request.GET.setlist(key, values)
+
+    request = Request(http_request)
+    request.user = (
+        get_user_model().objects.filter(pk=spec["user"]).first()
+        if spec["user"] is not None
+        else None
+    ) or AnonymousUser()
+
+    view = view_class(request=request, args=(), kwargs=spec["kwargs"], format_kwarg=None)
+    return view.filter_queryset(view.get_queryset())
+
+
+def refresh_exact_count(digest, spec):
+    count = rebuild_queryset(spec).count()
+
+    get_redis().set(COUNT_KEY.format(digest=digest), count, ex=settings.PAGINATION_COUNT_MAX_AGE)
+    return count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Counts exactly while the planner expects fewer than
+    PAGINATION_ESTIMATE_THRESHOLD rows. Above that it answers with the
+    last exact count cached in Redis, refreshed in the background at
+    most every PAGINATION_COUNT_REFRESH_INTERVAL seconds, or the planner
+    estimate until the first refresh lands. `count_is_approximate` says
+    which one was used. `spec` (see count_spec) lets the refresh task
+    rebuild the queryset; without it the cached count is never refreshed.
+    """
+
+    count_is_approximate = False
+
+    def __init__(self, *args, spec=None, **kwargs):
+        self.spec = spec
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+
+        try:
+            estimate = planner_estimate(queryset)
+        except Exception:
+            logger.exception("Planner count estimate failed, counting exactly")
+            estimate = None
+
+        if estimate is None or estimate < settings.PAGINATION_ESTIMATE_THRESHOLD:
+            return super().count
+
+        self.count_is_approximate = True
+        sql, params = count_sql(queryset)
+        digest = hashlib.sha256(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+
+        try:
+            redis = get_redis()
+            cached = redis.get(COUNT_KEY.format(digest=digest))
+            stale = redis.set(
+                REFRESH_KEY.format(digest=digest),
+                1,
+                nx=True,
+                ex=settings.PAGINATION_COUNT_REFRESH_INTERVAL,
+            )
+        except RedisError:
+            logger.exception("Count cache unavailable, using planner estimate")
+            return estimate
+
+        if stale and self.spec is not None:
+            from core.tasks import refresh_exact_count_task
+
+            refresh_exact_count_task.delay(digest, self.spec)
+
+        return int(cached) if cached is not None else estimate
+
+    def validate_number(self, number):
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+
+        # The estimate may undershoot; let any positive page through.
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return super().validate_number(number)
+        return number if number >= 1 else super().validate_number(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        page = self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+        self.settle(page)
+        return page
+
+    def settle(self, page):
+        """
+        Corrects an approximate count with what the page itself shows: a
+        short page ends the list, a full one means there may be more.
+        """
+        seen = (page.number - 1) * self.per_page + len(page.object_list)
+
+        if not page.object_list and page.number > 1:
+            # Past the end: only an upper bound is known.
+            self.__dict__["count"] = min(self.count, seen)
+        elif len(page.object_list) < self.per_page:
+            self.__dict__["count"] = seen
+            self.count_is_approximate = False
+        elif self.count <= seen:
+            self.__dict__["count"] = seen + 1
+
+        self.__dict__.pop("num_pages", None)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page numbers for lists that grow without bound. Large results report
+    an estimated or cached count, flagged by `count_is_approximate`.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+    page_size_query_param = "page_size"
+    max_page_size = 50
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if view is not None:
+            self.django_paginator_class = partial(
+                type(self).django_paginator_class,
+                spec=count_spec(request, view),
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.page.paginator.count,
+            "count_is_approximate": self.page.paginator.count_is_approximate,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_approximate"] = {"type": "boolean"}
+        return response_schema
@@ -0,0 +1,18 @@
+import redis
+from django.conf import settings
+
+
+_client = None
+
+
+def get_redis():
+    """
+    Returns a process-wide Redis client for app-level state
+    (queues, caches, counters). Celery and Channels keep their own.
+    """
+    global _client
+
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+
+    return _client
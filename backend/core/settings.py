@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'authentication.apps.AuthenticationConfig',
     'profiles.apps.ProfilesConfig',
@@ -189,6 +190,27 @@ CORS_ALLOW_METHODS = _get_list_env(
 
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 
+REDIS_URL = os.getenv(
+    "REDIS_URL",
+    f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', 6379)}/1",
+)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv(
+            "CACHE_REDIS_URL",
+            f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', 6379)}/2",
+        ),
+        "KEY_PREFIX": "talento",
+    }
+}
+
+# Public job pages are cached per query string until a Job or
+# RecruiterProfile save bumps their generation (jobs/response_cache.py);
+# RESPONSE_CACHE_TTL bounds how long an entry can outlive it.
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+
 
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND")
 EMAIL_HOST = os.getenv("EMAIL_HOST")
@@ -196,6 +218,8 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT"))
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS") == "True"
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
+# The mail worker runs a thread pool, where task time limits do not apply.
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", 30))
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 
 
@@ -252,3 +276,194 @@ RAZORPAY_WEBHOOK_SECRET = os.getenv("RAZORPAY_WEBHOOK_SECRET")
 
 
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+
+# Queues, one per workload so interactive mail never waits behind a
+# backlog of PDF parses or match fan-outs:
+#   mail          verification / password reset emails (threads pool)
+#   notifications in-app notifications and match emails   (threads pool)
+#   ai            embedding and LLM provider calls         (threads pool)
+#   pdf           CPU-bound PDF text extraction            (prefork pool)
+#   celery        periodic maintenance (default)           (prefork pool)
+# See docker-compose.yml for the worker per queue.
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+CELERY_TASK_ROUTES = {
+    "authentication.tasks.*": {"queue": "mail", "priority": 0},
+    "notifications.tasks.*": {"queue": "notifications", "priority": 3},
+    "embeddings.tasks.send_job_match_batch_task": {"queue": "notifications", "priority": 6},
+    "embeddings.tasks.notify_matching_candidates_task": {"queue": "notifications", "priority": 6},
+    "embeddings.tasks.start_resume_pipeline_task": {"queue": "pdf", "priority": 3},
+    "embeddings.tasks.extract_resume_text_task": {"queue": "pdf", "priority": 3},
+    "embeddings.tasks.generate_resume_embedding_task": {"queue": "pdf", "priority": 3},
+    # Interactive LLM work (an applicant or recruiter waiting on it) ahead of
+    # batch embedding and precomputation.
+    "embeddings.tasks.parse_resume_task": {"queue": "ai", "priority": 2},
+    "embeddings.tasks.generate_application_insight_task": {"queue": "ai", "priority": 2},
+    "embeddings.tasks.generate_job_resume_insight_task": {"queue": "ai", "priority": 2},
+    "embeddings.tasks.generate_resume_embedding_task_after_confirmation": {"queue": "ai", "priority": 4},
+    "embeddings.tasks.generate_job_embedding_task": {"queue": "ai", "priority": 4},
+    "embeddings.tasks.flush_embedding_queue_task": {"queue": "ai", "priority": 4},
+    "embeddings.tasks.precompute_*": {"queue": "ai", "priority": 8},
+}
+
+# With the Redis broker lower numbers run first (0 = highest). The
+# "priority" strategy also makes a worker consuming several queues drain
+# them in the order given to -Q.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "queue_order_strategy": "priority",
+    "priority_steps": list(range(10)),
+    "sep": ":",
+}
+CELERY_TASK_DEFAULT_PRIORITY = 5
+
+# Tasks here are long (PDF parses, provider calls); a worker reserves one
+# message per pool slot so queued work is not held by a busy process.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Port for the worker's Prometheus /metrics endpoint (0 disables it).
+# Pipeline stage timings, retries and token usage are in embeddings/metrics.py.
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", 0))
+
+
+# Embeddings
+# AI_BACKEND: "openai", "local" (deterministic, offline) or a dotted path
+# to a backend class. See embeddings/backends.py.
+AI_BACKEND = os.getenv("AI_BACKEND", "openai")
+
+# Saves are queued and embedded in one multi-input call once the queue
+# reaches EMBEDDING_BATCH_SIZE or every EMBEDDING_FLUSH_INTERVAL seconds.
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 64))
+EMBEDDING_FLUSH_INTERVAL = int(os.getenv("EMBEDDING_FLUSH_INTERVAL", 10))
+
+# Provider budgets per model, shared by every worker through Redis token
+# buckets (embeddings/ratelimit.py). Calls wait up to
+# AI_RATE_LIMIT_MAX_WAIT seconds for capacity, otherwise the work is
+# re-queued. A 429 pauses the model for its Retry-After, or for an
+# exponential backoff between the BASE and MAX values.
+AI_RATE_LIMITS = {
+    "text-embedding-3-small": {
+        "rpm": int(os.getenv("EMBEDDING_RPM_LIMIT", 3000)),
+        "tpm": int(os.getenv("EMBEDDING_TPM_LIMIT", 1_000_000)),
+    },
+    "gpt-4.1-mini": {
+        "rpm": int(os.getenv("COMPLETION_RPM_LIMIT", 500)),
+        "tpm": int(os.getenv("COMPLETION_TPM_LIMIT", 200_000)),
+    },
+}
+AI_RATE_LIMIT_MAX_WAIT = float(os.getenv("AI_RATE_LIMIT_MAX_WAIT", 2))
+AI_RATE_LIMIT_BASE_BACKOFF = float(os.getenv("AI_RATE_LIMIT_BASE_BACKOFF", 2))
+AI_RATE_LIMIT_MAX_BACKOFF = float(os.getenv("AI_RATE_LIMIT_MAX_BACKOFF", 120))
+
+# Seconds before a provider call is abandoned. The ai worker runs a
+# thread pool, where Celery time limits are not enforced, so this is
+# what bounds a hung request.
+AI_REQUEST_TIMEOUT = float(os.getenv("AI_REQUEST_TIMEOUT", 60))
+
+# Per-query-type ANN knobs, applied with SET LOCAL (see
+# embeddings/vector_search.py). A higher ef_search trades latency
+# for recall; hnsw.ef_search also caps how many rows a scan can return.
+VECTOR_SEARCH_PROFILES = {
+    "interactive": {
+        "hnsw.ef_search": int(os.getenv("VECTOR_INTERACTIVE_EF_SEARCH", 40)),
+    },
+    "bulk": {
+        "hnsw.ef_search": int(os.getenv("VECTOR_BULK_EF_SEARCH", 500)),
+    },
+}
+
+# Resume PDF limits. Documents with RESUME_PARALLEL_PAGE_THRESHOLD or more
+# pages are extracted by a pool of RESUME_EXTRACT_WORKERS processes.
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", 10 * 1024 * 1024))
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", 30))
+RESUME_PARALLEL_PAGE_THRESHOLD = int(os.getenv("RESUME_PARALLEL_PAGE_THRESHOLD", 8))
+RESUME_EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", 4))
+RESUME_PAGE_TIMEOUT = int(os.getenv("RESUME_PAGE_TIMEOUT", 10))
+RESUME_TASK_SOFT_TIME_LIMIT = int(os.getenv("RESUME_TASK_SOFT_TIME_LIMIT", 300))
+
+# Resume processing runs as a chain of stages (download + extract, LLM
+# parse, batched embed) that retry independently. Each stage runs at most
+# this many tasks at once across all workers (see embeddings/limits.py);
+# a task finding its stage full is re-queued after STAGE_BUSY_COUNTDOWN.
+PIPELINE_STAGE_CONCURRENCY = {
+    "extract": int(os.getenv("RESUME_EXTRACT_CONCURRENCY", 4)),
+    "parse": int(os.getenv("RESUME_PARSE_CONCURRENCY", 2)),
+    "embed": int(os.getenv("EMBEDDING_FLUSH_CONCURRENCY", 1)),
+}
+PIPELINE_STAGE_BUSY_COUNTDOWN = int(os.getenv("PIPELINE_STAGE_BUSY_COUNTDOWN", 5))
+EMBEDDING_FLUSH_TIME_LIMIT = int(os.getenv("EMBEDDING_FLUSH_TIME_LIMIT", 120))
+
+# Job-match notifications: how many top candidates are considered per new
+# job (keep <= the bulk hnsw.ef_search) and how many are emailed per
+# SMTP connection / notification insert.
+JOB_MATCH_MAX_RESULTS = int(os.getenv("JOB_MATCH_MAX_RESULTS", 500))
+JOB_MATCH_EMAIL_BATCH_SIZE = int(os.getenv("JOB_MATCH_EMAIL_BATCH_SIZE", 100))
+
+# Hybrid job search: candidates taken from each of the lexical and
+# vector rankings, and the reciprocal rank fusion constant.
+HYBRID_SEARCH_CANDIDATES = int(os.getenv("HYBRID_SEARCH_CANDIDATES", 40))
+HYBRID_SEARCH_RRF_K = int(os.getenv("HYBRID_SEARCH_RRF_K", 60))
+
+# Public job search facets (counts per filter value), cached per filter
+# set. Cities and skills are cut to the most frequent values.
+JOB_FACETS_CACHE_TTL = int(os.getenv("JOB_FACETS_CACHE_TTL", 60))
+JOB_FACETS_TOP_VALUES = int(os.getenv("JOB_FACETS_TOP_VALUES", 20))
+
+# Search query embeddings: in-process LRU in front of Redis.
+QUERY_EMBEDDING_CACHE_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", 60 * 60 * 24))
+QUERY_EMBEDDING_CACHE_LOCAL_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_LOCAL_SIZE", 1024))
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", 50000))
+
+# Memory-mapped matrix of active job embeddings used for batch similarity
+# scoring. All web workers on a host map the same snapshot file.
+EMBEDDING_SNAPSHOT_DIR = os.getenv("EMBEDDING_SNAPSHOT_DIR", os.path.join(BASE_DIR, "snapshots"))
+EMBEDDING_SNAPSHOT_INTERVAL = int(os.getenv("EMBEDDING_SNAPSHOT_INTERVAL", 600))
+EMBEDDING_MATRIX_DELTA_INTERVAL = int(os.getenv("EMBEDDING_MATRIX_DELTA_INTERVAL", 30))
+
+# Gap repair. backfill_embeddings runs batches with this concurrency and
+# estimated token budget; the periodic reconciler queues at most
+# EMBEDDING_RECONCILE_LIMIT rows of each kind per run. Resumes still
+# UPLOADED/PARSING after RESUME_STUCK_AFTER seconds are restarted.
+EMBEDDING_BACKFILL_CONCURRENCY = int(os.getenv("EMBEDDING_BACKFILL_CONCURRENCY", 4))
+EMBEDDING_BACKFILL_TOKENS_PER_MINUTE = int(os.getenv("EMBEDDING_BACKFILL_TOKENS_PER_MINUTE", 1_000_000))
+EMBEDDING_RECONCILE_INTERVAL = int(os.getenv("EMBEDDING_RECONCILE_INTERVAL", 15 * 60))
+EMBEDDING_RECONCILE_LIMIT = int(os.getenv("EMBEDDING_RECONCILE_LIMIT", 500))
+RESUME_STUCK_AFTER = int(os.getenv("RESUME_STUCK_AFTER", 60 * 60))
+
+# AI match insights are generated in the background; views answer
+# "pending" until they are ready. One LLM call runs per job/resume
+# version at a time (INSIGHT_LOCK_TTL bounds a crashed holder). Premium
+# jobseekers get insights for their INSIGHT_PRECOMPUTE_TOP_JOBS closest
+# jobs ahead of time.
+INSIGHT_PENDING_TTL = int(os.getenv("INSIGHT_PENDING_TTL", 300))
+INSIGHT_LOCK_TTL = int(os.getenv("INSIGHT_LOCK_TTL", 120))
+INSIGHT_POLL_AFTER = int(os.getenv("INSIGHT_POLL_AFTER", 3))
+INSIGHT_PRECOMPUTE_TOP_JOBS = int(os.getenv("INSIGHT_PRECOMPUTE_TOP_JOBS", 10))
+INSIGHT_PRECOMPUTE_INTERVAL = int(os.getenv("INSIGHT_PRECOMPUTE_INTERVAL", 60 * 60 * 6))
+
+# Large lists (admin users/jobs, transactions, notifications) count
+# exactly only while the planner expects fewer than
+# PAGINATION_ESTIMATE_THRESHOLD rows. Above it they report an exact count
+# cached in Redis for up to PAGINATION_COUNT_MAX_AGE seconds and refreshed
+# in the background at most every PAGINATION_COUNT_REFRESH_INTERVAL, or
+# the planner estimate until the first refresh. See core/pagination.py.
+PAGINATION_ESTIMATE_THRESHOLD = int(os.getenv("PAGINATION_ESTIMATE_THRESHOLD", 10000))
+PAGINATION_COUNT_REFRESH_INTERVAL = int(os.getenv("PAGINATION_COUNT_REFRESH_INTERVAL", 300))
+PAGINATION_COUNT_MAX_AGE = int(os.getenv("PAGINATION_COUNT_MAX_AGE", 60 * 60))
+
+CELERY_BEAT_SCHEDULE = {
+    "flush-embedding-queue": {
+        "task": "embeddings.tasks.flush_embedding_queue_task",
+        "schedule": EMBEDDING_FLUSH_INTERVAL,
+    },
+    "refresh-job-embedding-snapshot": {
+        "task": "embeddings.tasks.refresh_job_embedding_snapshot_task",
+        "schedule": EMBEDDING_SNAPSHOT_INTERVAL,
+    },
+    "reconcile-embeddings": {
+        "task": "embeddings.tasks.reconcile_embeddings_task",
+        "schedule": EMBEDDING_RECONCILE_INTERVAL,
+    },
+    "precompute-premium-job-insights": {
+        "task": "embeddings.tasks.precompute_premium_job_insights_task",
+        "schedule": INSIGHT_PRECOMPUTE_INTERVAL,
+    },
+}
@@ -34,3 +34,18 @@
 #     except Exception as exc:
 #         # Retry after 10 seconds
 #         raise self.retry(exc=exc, countdown=10)
+
+
+from celery import shared_task
+
+from core.pagination import refresh_exact_count
+
+
+@shared_task(ignore_result=True)
+def refresh_exact_count_task(digest, spec):
+    """
+    Rebuilds the list view's queryset from `spec`, counts it exactly and
+    caches the count under `digest` for the next requests (see
+    core/pagination.py).
+    """
+    return refresh_exact_count(digest, spec)
@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase, override_settings
+from redis.exceptions import RedisError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.pagination import EstimatedCountPagination, EstimatedCountPaginator
+
+
+factory = APIRequestFactory()
+
+
+class FakeQuerySet(list):
+    """Ordered rows with the bits of the QuerySet API the paginator uses."""
+
+    db = "default"
+    ordered = True
+
+    def count(self):
+        return len(self)
+
+
+@override_settings(
+    PAGINATION_ESTIMATE_THRESHOLD=100,
+    PAGINATION_COUNT_REFRESH_INTERVAL=60,
+    PAGINATION_COUNT_MAX_AGE=600,
+)
+class EstimatedCountPaginatorTests(SimpleTestCase):
+    spec = {"view": "dashboard.views.AdminJobListView", "kwargs": {}, "query": {}, "user": 1}
+
+    def setUp(self):
+        self.redis = mock.Mock()
+        self.redis.get.return_value = None
+        self.redis.set.return_value = True
+
+        patches = {
+            "estimate": mock.patch("core.pagination.planner_estimate"),
+            "count_sql": mock.patch(
+                "core.pagination.count_sql",
+                return_value=("SELECT COUNT(*) FROM jobs_job", []),
+            ),
+            "redis": mock.patch("core.pagination.get_redis", return_value=self.redis),
+            "refresh": mock.patch("core.tasks.refresh_exact_count_task.delay"),
+        }
+        self.mocks = {name: patch.start() for name, patch in patches.items()}
+        for patch in patches.values():
+            self.addCleanup(patch.stop)
+
+    def paginator(self, rows=30, per_page=10, spec=spec):
+        return EstimatedCountPaginator(FakeQuerySet(range(rows)), per_page, spec=spec)
+
+    def test_exact_count_below_threshold(self):
+        self.mocks["estimate"].return_value = 99
+        paginator = self.paginator()
+
+        self.assertEqual(paginator.count, 30)
+        self.assertFalse(paginator.count_is_approximate)
+        self.mocks["redis"].assert_not_called()
+
+    def test_estimate_above_threshold_and_refresh_dispatched(self):
+        self.mocks["estimate"].return_value = 5000
+        paginator = self.paginator()
+
+        self.assertEqual(paginator.count, 5000)
+        self.assertTrue(paginator.count_is_approximate)
+
+        digest = self.mocks["refresh"].call_args.args[0]
+        self.mocks["refresh"].assert_called_once_with(digest, self.spec)
+        self.redis.get.assert_called_once_with(f"pagination:count:{digest}")
+
+    def test_cached_exact_count_preferred_to_estimate(self):
+        self.mocks["estimate"].return_value = 5000
+        self.redis.get.return_value = b"4321"
+        self.redis.set.return_value = None
+        paginator = self.paginator()
+
+        self.assertEqual(paginator.count, 4321)
+        self.assertTrue(paginator.count_is_approximate)
+        self.mocks["refresh"].assert_not_called()
+
+    def test_no_refresh_without_spec(self):
+        self.mocks["estimate"].return_value = 5000
+
+        self.assertEqual(self.paginator(spec=None).count, 5000)
+        self.mocks["refresh"].assert_not_called()
+
+    def test_estimate_used_when_redis_down(self):
+        self.mocks["estimate"].return_value = 5000
+        self.redis.get.side_effect = RedisError("down")
+
+        with self.assertLogs("core.pagination", "ERROR"):
+            self.assertEqual(self.paginator().count, 5000)
+
+    def test_failed_estimate_counts_exactly(self):
+        self.mocks["estimate"].side_effect = RuntimeError("no plan")
+
+        with self.assertLogs("core.pagination", "ERROR"):
+            self.assertEqual(self.paginator().count, 30)
+
+    def test_short_page_settles_exact_count(self):
+        self.mocks["estimate"].return_value = 5000
+        paginator = self.paginator(rows=25)
+
+        page = paginator.page(3)
+
+        self.assertEqual(len(page.object_list), 5)
+        self.assertEqual(paginator.count, 25)
+        self.assertFalse(paginator.count_is_approximate)
+        self.assertFalse(page.has_next())
+
+    def test_full_page_past_undershooting_estimate_keeps_next(self):
+        self.mocks["estimate"].return_value = 150
+        self.redis.get.return_value = b"15"
+        paginator = self.paginator(rows=30)
+
+        page = paginator.page(2)
+
+        self.assertEqual(paginator.count, 21)
+        self.assertTrue(paginator.count_is_approximate)
+        self.assertTrue(page.has_next())
+
+    def test_empty_page_past_the_end_bounds_count(self):
+        self.mocks["estimate"].return_value = 5000
+        paginator = self.paginator(rows=30)
+
+        page = paginator.page(10)
+
+        self.assertEqual(list(page.object_list), [])
+        self.assertEqual(paginator.count, 90)
+        self.assertTrue(paginator.count_is_approximate)
+
+    def test_pagination_response_flags_approximate_count(self):
+        self.mocks["estimate"].return_value = 5000
+        pagination = EstimatedCountPagination()
+        pagination.page_size = 10
+        request = Request(factory.get("/api/admin/jobs/", {"status": "published"}))
+        request.user = AnonymousUser()
+        view = SimpleNamespace(kwargs={})
+
+        rows = pagination.paginate_queryset(FakeQuerySet(range(30)), request, view)
+        response = pagination.get_paginated_response(rows)
+
+        self.assertEqual(rows, list(range(10)))
+        self.assertEqual(response.data["count"], 5000)
+        self.assertTrue(response.data["count_is_approximate"])
+
+        spec = self.mocks["refresh"].call_args.args[1]
+        self.assertEqual(spec["query"], {"status": ["published"]})
+        self.assertIsNone(spec["user"])
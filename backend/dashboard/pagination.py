@@ -1,7 +1,13 @@
 from rest_framework.pagination import PageNumberPagination
 
+from core.pagination import EstimatedCountPagination
+
 
 class AdminJobPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+class AdminJobListPagination(EstimatedCountPagination):
+    page_size = 12
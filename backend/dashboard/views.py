@@ -12,10 +12,11 @@ from rest_framework.generics import ListAPIView
 from authentication.models import UserModel
 from core.permissions import IsAdmin
 from jobs.models.job import Job
-from jobs.pagination import RecruiterJobPagination
+from core.pagination import EstimatedCountPagination
 from recruiter.models import RecruiterProfile
 
 from .filters import AdminJobFilter
+from .pagination import AdminJobListPagination
 from .serializers import (
     AdminJobDetailSerializer,
     AdminJobListSerializer,
@@ -96,6 +97,7 @@ class TransactionExportCSVAPIView(APIView):
 class TransactionListAPIView(ListAPIView):
     serializer_class = TransactionListSerializer
     permission_classes = [IsAdmin]
+    pagination_class = EstimatedCountPagination
 
     filter_backends = [
         DjangoFilterBackend,
@@ -226,7 +228,7 @@ class AdminToggleBlockUserView(APIView):
 class AdminJobListView(generics.ListAPIView):
     serializer_class = AdminJobListSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
-    pagination_class = RecruiterJobPagination
+    pagination_class = AdminJobListPagination
     queryset = Job.objects.all()
 
     filter_backends = [
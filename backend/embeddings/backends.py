@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import os
+import re
+
+import numpy as np
+from django.conf import settings
+from django.utils.module_loading import import_string
+from openai import OpenAI, RateLimitError
+
+from embeddings.metrics import record_tokens
+from embeddings.ratelimit import (
+    RateLimited,
+    estimate_tokens,
+    report_rate_limited,
+    report_usage,
+    throttle,
+)
+
+logger = logging.getLogger(__name__)
+
+
+EMBED_DIMENSIONS = 1536
+
+
+class OpenAIBackend:
+    embed_model = "text-embedding-3-small"  # fast + cheap (1536 dims)
+    completion_model = "gpt-4.1-mini"
+
+    # Output budget reserved per completion until actual usage is known.
+    completion_token_reserve = 1000
+
+    def __init__(self):
+        # 429s are handled by the shared governor (embeddings/ratelimit.py),
+        # not by per-process SDK retries.
+        self.client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=0,
+            timeout=settings.AI_REQUEST_TIMEOUT,
+        )
+
+    def _rate_limited(self, model, exc):
+        headers = exc.response.headers if exc.response is not None else {}
+
+        if headers.get("retry-after-ms"):
+            retry_after = float(headers["retry-after-ms"]) / 1000
+        elif headers.get("retry-after"):
+            try:
+                retry_after = float(headers["retry-after"])
+            except ValueError:
+                retry_after = None
+        else:
+            retry_after = None
+
+        return RateLimited(model, report_rate_limited(model, retry_after))
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        estimated = estimate_tokens(texts)
+        throttle(self.embed_model, estimated)
+
+        try:
+            response = self.client.embeddings.create(
+                model=self.embed_model,
+                input=texts
+            )
+        except RateLimitError as exc:
+            raise self._rate_limited(self.embed_model, exc) from exc
+
+        report_usage(self.embed_model, estimated, response.usage.total_tokens)
+        record_tokens(self.embed_model, input_tokens=response.usage.total_tokens)
+
+        data = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in data]
+
+    def complete(self, prompt: str) -> str:
+        estimated = estimate_tokens([prompt]) + self.completion_token_reserve
+        throttle(self.completion_model, estimated)
+
+        try:
+            response = self.client.responses.create(
+                model=self.completion_model,
+                input=prompt,
+            )
+        except RateLimitError as exc:
+            raise self._rate_limited(self.completion_model, exc) from exc
+
+        report_usage(self.completion_model, estimated, response.usage.total_tokens)
+        record_tokens(
+            self.completion_model,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+        return response.output_text
+
+
+class LocalBackend:
+    """
+    Deterministic offline backend for CI and load tests.
+
+    Embeddings are signed feature hashes of the text's tokens, L2
+    normalised, so texts sharing vocabulary score as similar.
+    Completions echo the JSON template embedded in the prompt, which
+    gives callers a response of the right shape.
+    """
+
+    embed_model = f"local-feature-hash-{EMBED_DIMENSIONS}"
+    completion_model = "local-template-echo"
+
+    TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+    TEMPLATE_RE = re.compile(r"\{[^{}]*\}", re.DOTALL)
+
+    def _hash_tokens(self, text):
+        tokens = self.TOKEN_RE.findall(text.lower())
+        hashes = np.array(
+            [
+                int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+                for token in tokens
+            ],
+            dtype=np.uint64,
+        )
+        indices = (hashes % EMBED_DIMENSIONS).astype(np.intp)
+        signs = np.where(hashes >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+        return indices, signs
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        matrix = np.zeros((len(texts), EMBED_DIMENSIONS), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            indices, signs = self._hash_tokens(text)
+            np.add.at(matrix[row], indices, signs)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        return (matrix / norms).tolist()
+
+    def complete(self, prompt: str) -> str:
+        match = self.TEMPLATE_RE.search(prompt)
+        return match.group(0) if match else "{}"
+
+
+BACKENDS = {
+    "openai": OpenAIBackend,
+    "local": LocalBackend,
+}
+
+_backend = None
+
+
+def get_backend():
+    """
+    Returns the process-wide AI backend named by settings.AI_BACKEND,
+    either a key of BACKENDS or a dotted path to a backend class.
+    """
+    global _backend
+
+    if _backend is None:
+        name = settings.AI_BACKEND
+        backend_class = BACKENDS.get(name) or import_string(name)
+        _backend = backend_class()
+
+        logger.info(f"AI backend loaded | backend={name}")
+
+    return _backend
@@ -0,0 +1,95 @@
+import logging
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.redis import get_redis
+from jobs.models.job import Job
+from profiles.models import JobSeekerResume
+
+logger = logging.getLogger(__name__)
+
+
+CHECKPOINT_KEY = "embeddings:backfill:checkpoint"
+CURSOR_CHUNK_SIZE = 2000
+
+
+def get_checkpoint(kind):
+    value = get_redis().hget(CHECKPOINT_KEY, kind)
+    return int(value) if value else 0
+
+
+def set_checkpoint(kind, last_id):
+    get_redis().hset(CHECKPOINT_KEY, kind, last_id)
+
+
+def reset_checkpoints(kinds):
+    get_redis().hdel(CHECKPOINT_KEY, *kinds)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def jobs_needing_embedding():
+    """
+    Jobs with no embedding, or saved since their embedding was last
+    written or verified.
+    """
+    return Job.objects.filter(
+        Q(embedding__isnull=True) | Q(embedding__updated_at__lt=F("updated_at"))
+    )
+
+
+def missing_resume_embeddings():
+    return JobSeekerResume.objects.filter(
+        status__in=[JobSeekerResume.Status.PARSED, JobSeekerResume.Status.CONFIRMED],
+        parsed_data__isnull=False,
+        is_deleted=False,
+        embedding__isnull=True,
+    )
+
+
+def stuck_resumes():
+    """
+    Resumes never picked up by the pipeline, or still parsing long after
+    any attempt could have finished.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.RESUME_STUCK_AFTER)
+    return JobSeekerResume.objects.filter(
+        status__in=[JobSeekerResume.Status.UPLOADED, JobSeekerResume.Status.PARSING],
+        is_deleted=False,
+        uploaded_at__lt=cutoff,
+    )
+
+
+def stream_ids(queryset, after_id=0):
+    """
+    Yields ids above `after_id` in order, through a server-side cursor
+    so the full candidate set is never loaded at once.
+    """
+    return (
+        queryset.filter(id__gt=after_id)
+        .order_by("id")
+        .values_list("id", flat=True)
+        .iterator(chunk_size=CURSOR_CHUNK_SIZE)
+    )
+
+
+BACKFILL_SOURCES = {
+    # kind: (all candidates, only rows needing work)
+    "jobs": (
+        lambda: Job.objects.all(),
+        jobs_needing_embedding,
+    ),
+    "resumes": (
+        lambda: JobSeekerResume.objects.filter(parsed_data__isnull=False, is_deleted=False),
+        missing_resume_embeddings,
+    ),
+    "stuck-resumes": (stuck_resumes, stuck_resumes),
+}
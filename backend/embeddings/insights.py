@@ -0,0 +1,203 @@
+import hashlib
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from applications.models import ApplicationInsight
+from core.redis import get_redis
+from embeddings.metrics import stage_timer
+from embeddings.models import JobResumeInsight
+from embeddings.services import build_job_text, generate_application_insight
+
+logger = logging.getLogger(__name__)
+
+
+PENDING_KEY = "insights:pending:{kind}:{key}"
+LOCK_KEY = "insights:lock:{job_id}:{resume_id}:{job_version}:{resume_version}"
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class InsightInProgress(Exception):
+    """Another worker holds the single-flight lock for this insight."""
+
+
+def mark_pending(kind, key):
+    """
+    Claims the pending marker for an insight. Returns False when a
+    generation is already queued, so repeated polls enqueue it once.
+    """
+    try:
+        return bool(
+            get_redis().set(
+                PENDING_KEY.format(kind=kind, key=key),
+                1,
+                nx=True,
+                ex=settings.INSIGHT_PENDING_TTL,
+            )
+        )
+    except RedisError:
+        logger.exception(f"Insight pending marker unavailable | kind={kind} key={key}")
+        return True
+
+
+def clear_pending(kind, key):
+    try:
+        get_redis().delete(PENDING_KEY.format(kind=kind, key=key))
+    except RedisError:
+        logger.exception(f"Insight pending marker unavailable | kind={kind} key={key}")
+
+
+def job_version(job):
+    # build_job_text covers every job field the insight prompt uses.
+    return hashlib.sha256(build_job_text(job).encode("utf-8")).hexdigest()
+
+
+def resume_version(resume):
+    payload = json.dumps(resume.parsed_data or {}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_current_insight(job, resume):
+    """
+    Returns the stored insight for the pair if it was generated from the
+    current job text and parsed resume, else None.
+    """
+    return JobResumeInsight.objects.filter(
+        job=job,
+        resume=resume,
+        job_version=job_version(job),
+        resume_version=resume_version(resume),
+    ).first()
+
+
+@contextmanager
+def single_flight(key):
+    """
+    Yields True for the one caller holding `key`; others get False.
+    Fails open if Redis is unavailable.
+    """
+    token = uuid.uuid4().hex
+
+    try:
+        acquired = bool(
+            get_redis().set(key, token, nx=True, ex=settings.INSIGHT_LOCK_TTL)
+        )
+    except RedisError:
+        logger.exception(f"Insight lock unavailable | key={key}")
+        acquired, token = True, None
+
+    if not acquired:
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        if token is not None:
+            try:
+                get_redis().eval(_RELEASE_SCRIPT, 1, key, token)
+            except RedisError:
+                logger.exception(f"Insight lock release failed | key={key}")
+
+
+def get_or_generate_insight(job, resume):
+    """
+    Returns the current insight for a job/resume pair, generating it at
+    most once per content version across all workers. Raises
+    InsightInProgress when another worker is generating it.
+    """
+    versions = {
+        "job_version": job_version(job),
+        "resume_version": resume_version(resume),
+    }
+
+    insight = JobResumeInsight.objects.filter(job=job, resume=resume, **versions).first()
+    if insight:
+        return insight
+
+    lock_key = LOCK_KEY.format(job_id=job.id, resume_id=resume.id, **versions)
+
+    with single_flight(lock_key) as acquired:
+        if not acquired:
+            raise InsightInProgress(f"Insight in progress | job_id={job.id} resume_id={resume.id}")
+
+        # The previous holder may have finished between the lookup and the lock.
+        insight = JobResumeInsight.objects.filter(job=job, resume=resume, **versions).first()
+        if insight:
+            return insight
+
+        with stage_timer("insight"):
+            result = generate_application_insight(job, resume.parsed_data)
+
+        insight, _ = JobResumeInsight.objects.update_or_create(
+            job=job,
+            resume=resume,
+            defaults={
+                "strengths": result.get("strengths", []),
+                "gaps": result.get("gaps", []),
+                "summary": result.get("summary", ""),
+                **versions,
+            },
+        )
+
+    return insight
+
+
+def save_application_insight(application):
+    insight = get_or_generate_insight(application.job, application.applied_resume)
+
+    record, _ = ApplicationInsight.objects.update_or_create(
+        application=application,
+        defaults={
+            "strengths": insight.strengths,
+            "gaps": insight.gaps,
+            "summary": insight.summary,
+        },
+    )
+    return record
+
+
+def save_job_resume_insight(job, resume):
+    return get_or_generate_insight(job, resume)
+
+
+def invalidate_job_insights(job):
+    """
+    Drops insights generated from an older version of the job's text,
+    along with the application copies made from them.
+    """
+    stale = JobResumeInsight.objects.filter(job=job).exclude(job_version=job_version(job))
+
+    ApplicationInsight.objects.filter(
+        application__job=job,
+        application__applied_resume__in=stale.values("resume_id"),
+    ).delete()
+    deleted, _ = stale.delete()
+
+    if deleted:
+        logger.info(f"Stale insights invalidated | job_id={job.id} count={deleted}")
+
+
+def invalidate_resume_insights(resume):
+    stale = JobResumeInsight.objects.filter(resume=resume).exclude(
+        resume_version=resume_version(resume)
+    )
+
+    ApplicationInsight.objects.filter(
+        application__applied_resume=resume,
+        application__job__in=stale.values("job_id"),
+    ).delete()
+    deleted, _ = stale.delete()
+
+    if deleted:
+        logger.info(f"Stale insights invalidated | resume_id={resume.id} count={deleted}")
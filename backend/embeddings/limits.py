@@ -0,0 +1,61 @@
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+
+from redis.exceptions import RedisError
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+STAGE_SLOTS_KEY = "embeddings:slots:{stage}"
+
+# Drop holders older than ttl (crashed workers), then take a slot if one
+# is free. Holders are a zset of token -> acquired-at.
+_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', tonumber(ARGV[1]) - tonumber(ARGV[2]))
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+_acquire = None
+
+
+@contextmanager
+def stage_slot(stage, limit, ttl):
+    """
+    Cluster-wide semaphore for a pipeline stage. Yields True when one of
+    `limit` slots was taken; slots held longer than `ttl` seconds are
+    reclaimed. Fails open if Redis is unavailable.
+    """
+    global _acquire
+
+    key = STAGE_SLOTS_KEY.format(stage=stage)
+    token = uuid.uuid4().hex
+
+    try:
+        if _acquire is None:
+            _acquire = get_redis().register_script(_ACQUIRE_SCRIPT)
+        acquired = bool(_acquire(keys=[key], args=[time.time(), ttl, limit, token]))
+    except RedisError:
+        logger.exception(f"Stage limiter unavailable | stage={stage}")
+        acquired, token = True, None
+
+    if not acquired:
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        if token is not None:
+            try:
+                get_redis().zrem(key, token)
+            except RedisError:
+                logger.exception(f"Stage slot release failed | stage={stage}")
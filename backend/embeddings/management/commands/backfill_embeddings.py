@@ -0,0 +1,177 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from embeddings.backfill import (
+    BACKFILL_SOURCES,
+    batched,
+    get_checkpoint,
+    reset_checkpoints,
+    set_checkpoint,
+    stream_ids,
+)
+from embeddings.ratelimit import RateLimited
+from embeddings.tasks import embed_batch, start_resume_pipeline
+
+
+class Command(BaseCommand):
+    help = (
+        "Embed jobs and resumes that have no (or an outdated) embedding and "
+        "restart stuck resume parses. Progress is checkpointed per kind, so "
+        "an interrupted run continues where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=list(BACKFILL_SOURCES),
+            help="Kind to process (repeatable). Defaults to all kinds.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-check every row's content hash instead of only rows known to need work.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMBEDDING_BATCH_SIZE,
+            help="Rows per provider call.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.EMBEDDING_BACKFILL_CONCURRENCY,
+            help="Batches in flight at once.",
+        )
+        parser.add_argument(
+            "--tokens-per-minute",
+            type=int,
+            default=settings.EMBEDDING_BACKFILL_TOKENS_PER_MINUTE,
+            help="Estimated provider tokens per minute to stay under (0 = unlimited).",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Ignore saved checkpoints and start from the lowest id.",
+        )
+        parser.add_argument(
+            "--report-every",
+            type=float,
+            default=10,
+            help="Seconds between progress lines.",
+        )
+
+    def handle(self, *args, **options):
+        kinds = options["kind"] or list(BACKFILL_SOURCES)
+
+        if options["reset"]:
+            reset_checkpoints(kinds)
+
+        for kind in kinds:
+            self.backfill(kind, options)
+
+    def backfill(self, kind, options):
+        all_rows, needing_work = BACKFILL_SOURCES[kind]
+        queryset = all_rows() if options["all"] else needing_work()
+
+        after_id = get_checkpoint(kind)
+        if after_id:
+            self.stdout.write(f"{kind}: resuming after id {after_id}")
+
+        concurrency = max(options["concurrency"], 1)
+        self.started = self.last_report = time.monotonic()
+        self.items = self.tokens = 0
+
+        # Batches in submission order as [last_id, done]. The checkpoint
+        # only advances past a batch once every earlier batch is done.
+        order = deque()
+        inflight = {}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            try:
+                for ids in batched(stream_ids(queryset, after_id), options["batch_size"]):
+                    self.throttle(options["tokens_per_minute"])
+
+                    while len(inflight) >= concurrency:
+                        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                        self.collect(kind, done, inflight, order, options)
+
+                    entry = [ids[-1], False]
+                    order.append(entry)
+                    inflight[pool.submit(self.process, kind, ids)] = entry
+
+                while inflight:
+                    done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                    self.collect(kind, done, inflight, order, options)
+
+            except Exception as exc:
+                for future in inflight:
+                    future.cancel()
+                raise CommandError(
+                    f"{kind}: stopped at checkpoint {get_checkpoint(kind)}: {exc}"
+                ) from exc
+
+        self.report(kind, final=True)
+        # Finished: the next run starts a fresh pass.
+        reset_checkpoints([kind])
+
+    def process(self, kind, ids):
+        try:
+            if kind == "stuck-resumes":
+                for resume_id in ids:
+                    start_resume_pipeline(resume_id)
+                return len(ids), 0
+
+            while True:
+                try:
+                    if kind == "jobs":
+                        result = embed_batch(job_ids=ids, notify=False)
+                    else:
+                        result = embed_batch(resume_ids=ids, notify=False)
+                    return len(ids), result["tokens"]
+                except RateLimited as exc:
+                    time.sleep(exc.retry_after)
+        finally:
+            # Worker threads hold their own connections.
+            connection.close()
+
+    def collect(self, kind, done, inflight, order, options):
+        for future in done:
+            entry = inflight.pop(future)
+            items, tokens = future.result()
+            entry[1] = True
+            self.items += items
+            self.tokens += tokens
+
+        while order and order[0][1]:
+            set_checkpoint(kind, order.popleft()[0])
+
+        if time.monotonic() - self.last_report >= options["report_every"]:
+            self.report(kind)
+
+    def throttle(self, tokens_per_minute):
+        if not tokens_per_minute:
+            return
+
+        elapsed = time.monotonic() - self.started
+        ahead = self.tokens / tokens_per_minute * 60 - elapsed
+        if ahead > 0:
+            time.sleep(ahead)
+
+    def report(self, kind, final=False):
+        self.last_report = time.monotonic()
+        elapsed = max(self.last_report - self.started, 1e-6)
+
+        line = (
+            f"{kind}: {self.items} items in {elapsed:.1f}s | "
+            f"{self.items / elapsed:.1f} items/s | "
+            f"{self.tokens / elapsed:.0f} est. tokens/s | "
+            f"checkpoint {get_checkpoint(kind)}"
+        )
+        self.stdout.write(self.style.SUCCESS(line) if final else line)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from embeddings.vector_search import VECTOR_INDEXES
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the embedding ANN indexes with REINDEX CONCURRENTLY, "
+        "so reads and writes continue during the rebuild"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--index",
+            action="append",
+            choices=VECTOR_INDEXES,
+            help="Index to rebuild (repeatable). Defaults to all vector indexes.",
+        )
+        parser.add_argument(
+            "--maintenance-work-mem",
+            default="1GB",
+            help="maintenance_work_mem for the build; HNSW builds are much faster when the graph fits.",
+        )
+        parser.add_argument(
+            "--parallel-workers",
+            type=int,
+            default=2,
+            help="max_parallel_maintenance_workers for the build.",
+        )
+
+    def handle(self, *args, **options):
+        indexes = options["index"] or VECTOR_INDEXES
+
+        if connection.in_atomic_block:
+            raise CommandError("REINDEX CONCURRENTLY cannot run inside a transaction")
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('maintenance_work_mem', %s, false)",
+                [options["maintenance_work_mem"]],
+            )
+            cursor.execute(
+                "SELECT set_config('max_parallel_maintenance_workers', %s, false)",
+                [str(options["parallel_workers"])],
+            )
+
+            for index in indexes:
+                self.stdout.write(f"Rebuilding {index} ...")
+                cursor.execute(f"REINDEX INDEX CONCURRENTLY {connection.ops.quote_name(index)}")
+                self.stdout.write(self.style.SUCCESS(f"Rebuilt {index}"))
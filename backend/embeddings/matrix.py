@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from embeddings.backends import EMBED_DIMENSIONS
+from embeddings.models import JobEmbedding
+from jobs.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+MATRIX_FILE = "job_embeddings.npy"
+IDS_FILE = "job_embedding_ids.npy"
+META_FILE = "job_embeddings.json"
+
+SNAPSHOT_CHUNK_SIZE = 2000
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _snapshot_path(name):
+    return os.path.join(settings.EMBEDDING_SNAPSHOT_DIR, name)
+
+
+def build_job_embedding_snapshot():
+    """
+    Writes L2-normalised embeddings of all published, active jobs to
+    .npy files sorted by job id, so readers can memory-map them and
+    look rows up with searchsorted. Files are swapped in atomically.
+    """
+    os.makedirs(settings.EMBEDDING_SNAPSHOT_DIR, exist_ok=True)
+
+    started_at = timezone.now()
+
+    job_ids = np.array(
+        sorted(
+            JobEmbedding.objects.filter(
+                job__status=Job.Status.PUBLISHED,
+                job__is_active=True,
+            ).values_list("job_id", flat=True)
+        ),
+        dtype=np.int64,
+    )
+
+    tmp_matrix = _snapshot_path(f"{MATRIX_FILE}.tmp")
+    matrix = np.lib.format.open_memmap(
+        tmp_matrix,
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(job_ids), EMBED_DIMENSIONS),
+    )
+    # Rows whose embedding disappears mid-build stay NaN and never score.
+    matrix[:] = np.nan
+
+    for start in range(0, len(job_ids), SNAPSHOT_CHUNK_SIZE):
+        chunk = job_ids[start:start + SNAPSHOT_CHUNK_SIZE]
+        rows = JobEmbedding.objects.filter(job_id__in=chunk.tolist()).values_list("job_id", "embedding")
+
+        for job_id, embedding in rows:
+            row = start + int(np.searchsorted(chunk, job_id))
+            matrix[row] = _normalize(np.asarray(embedding, dtype=np.float32))
+
+    matrix.flush()
+    del matrix
+
+    tmp_ids = _snapshot_path(f"{IDS_FILE}.tmp")
+    with open(tmp_ids, "wb") as f:
+        np.save(f, job_ids)
+
+    tmp_meta = _snapshot_path(f"{META_FILE}.tmp")
+    with open(tmp_meta, "w") as f:
+        json.dump({"created_at": started_at.isoformat(), "rows": len(job_ids)}, f)
+
+    # Meta goes last: readers reload when it changes.
+    os.replace(tmp_matrix, _snapshot_path(MATRIX_FILE))
+    os.replace(tmp_ids, _snapshot_path(IDS_FILE))
+    os.replace(tmp_meta, _snapshot_path(META_FILE))
+
+    logger.info(f"Job embedding snapshot written | rows={len(job_ids)}")
+
+    return len(job_ids)
+
+
+class JobEmbeddingMatrix:
+    """
+    Read side of the job embedding snapshot.
+
+    The matrix is memory-mapped, so every worker process on a host
+    shares one copy through the page cache. Rows written after the
+    snapshot are pulled into a small per-process overlay at most every
+    `delta_interval` seconds.
+    """
+
+    def __init__(self, delta_interval):
+        self.delta_interval = delta_interval
+
+        self._lock = threading.Lock()
+        self._meta_mtime = None
+        self._matrix = None
+        self._ids = None
+        self._synced_at = None
+        self._checked_at = 0.0
+        self._overlay = {}
+
+    def _load_snapshot(self):
+        try:
+            meta_mtime = os.path.getmtime(_snapshot_path(META_FILE))
+        except OSError:
+            return
+
+        if meta_mtime == self._meta_mtime:
+            return
+
+        with open(_snapshot_path(META_FILE)) as f:
+            meta = json.load(f)
+
+        matrix = np.load(_snapshot_path(MATRIX_FILE), mmap_mode="r")
+        ids = np.load(_snapshot_path(IDS_FILE))
+
+        if matrix.shape[0] != len(ids):
+            # Caught a snapshot mid-swap; try again on the next refresh.
+            return
+
+        self._matrix = matrix
+        self._ids = ids
+        self._synced_at = parse_datetime(meta["created_at"])
+        self._meta_mtime = meta_mtime
+        self._overlay = {}
+
+        logger.info(f"Job embedding snapshot loaded | rows={meta['rows']}")
+
+    def _load_delta(self):
+        if self._synced_at is None:
+            return
+
+        rows = (
+            JobEmbedding.objects.filter(updated_at__gt=self._synced_at)
+            .order_by("updated_at")
+            .values_list("job_id", "embedding", "updated_at")
+        )
+
+        for job_id, embedding, updated_at in rows:
+            self._overlay[job_id] = _normalize(np.asarray(embedding, dtype=np.float32))
+            self._synced_at = updated_at
+
+    def refresh(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at < self.delta_interval:
+                return
+
+            self._checked_at = now
+            self._load_snapshot()
+            self._load_delta()
+
+    def similarities(self, job_ids, vector) -> dict:
+        """
+        Cosine similarity of `vector` against each job in `job_ids`.
+        Jobs not in the snapshot or overlay are left out of the result.
+        """
+        self.refresh()
+
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        scores = {}
+
+        remaining = []
+        for job_id in job_ids:
+            if job_id in self._overlay:
+                scores[job_id] = float(self._overlay[job_id] @ query)
+            else:
+                remaining.append(job_id)
+
+        if self._ids is None or not remaining or not len(self._ids):
+            return scores
+
+        wanted = np.asarray(remaining, dtype=np.int64)
+        rows = np.searchsorted(self._ids, wanted).clip(max=len(self._ids) - 1)
+        found = self._ids[rows] == wanted
+
+        if found.any():
+            values = self._matrix[rows[found]] @ query
+            for job_id, value in zip(wanted[found].tolist(), values.tolist()):
+                if np.isfinite(value):
+                    scores[job_id] = value
+
+        return scores
+
+
+job_embedding_matrix = JobEmbeddingMatrix(
+    delta_interval=settings.EMBEDDING_MATRIX_DELTA_INTERVAL,
+)
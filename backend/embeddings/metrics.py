@@ -0,0 +1,64 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from celery.signals import task_retry
+from prometheus_client import Counter, Histogram
+
+
+STAGE_SECONDS = Histogram(
+    "talento_pipeline_stage_seconds",
+    "Time spent in each resume/embedding pipeline stage.",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+STAGE_ERRORS = Counter(
+    "talento_pipeline_stage_errors_total",
+    "Pipeline stage runs that raised.",
+    ["stage"],
+)
+STAGE_TOKENS = Counter(
+    "talento_pipeline_stage_tokens_total",
+    "Provider tokens used, by stage, model and direction.",
+    ["stage", "model", "direction"],
+)
+TASK_RETRIES = Counter(
+    "talento_pipeline_task_retries_total",
+    "Celery task retries.",
+    ["task"],
+)
+
+_current_stage = ContextVar("pipeline_stage", default="other")
+
+
+@contextmanager
+def stage_timer(stage):
+    """
+    Observes the block's duration under `stage`. Provider calls made
+    inside it attribute their token usage to the same stage.
+    """
+    token = _current_stage.set(stage)
+    start = time.perf_counter()
+
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - start)
+        _current_stage.reset(token)
+
+
+def record_tokens(model, input_tokens=0, output_tokens=0):
+    stage = _current_stage.get()
+
+    if input_tokens:
+        STAGE_TOKENS.labels(stage, model, "input").inc(input_tokens)
+    if output_tokens:
+        STAGE_TOKENS.labels(stage, model, "output").inc(output_tokens)
+
+
+@task_retry.connect
+def count_task_retry(sender=None, **kwargs):
+    TASK_RETRIES.labels(sender.name if sender else "unknown").inc()
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("embeddings", "0009_embedding_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS job_embedding_hnsw_idx
+            ON embeddings_jobembedding
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64);
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS job_embedding_hnsw_idx;",
+        ),
+        migrations.RunSQL(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS resume_embedding_hnsw_idx
+            ON embeddings_resumeembedding
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64);
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS resume_embedding_hnsw_idx;",
+        ),
+        migrations.RunSQL(
+            "DROP INDEX CONCURRENTLY IF EXISTS job_embedding_idx;",
+            reverse_sql="""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS job_embedding_idx
+            ON embeddings_jobembedding
+            USING ivfflat (embedding vector_cosine_ops)
+            WITH (lists = 100);
+            """,
+        ),
+    ]
@@ -0,0 +1,74 @@
+import pgvector.django.halfvec
+from django.db import migrations
+
+
+# Stores embeddings as pgvector halfvec (float16), halving table and
+# index size. Roll back to 0010 to return to full-precision vectors.
+#
+# Lock window: each ALTER COLUMN TYPE rewrites its table under an ACCESS
+# EXCLUSIVE lock (reads and writes of that table wait). The HNSW indexes
+# are dropped and rebuilt CONCURRENTLY around it, so only the rewrites
+# block; ANN queries fall back to sequential scans until the rebuild ends.
+
+
+def create_index(name, table, opclass):
+    return f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS {name}
+    ON {table}
+    USING hnsw (embedding {opclass})
+    WITH (m = 16, ef_construction = 64);
+    """
+
+
+def drop_index(name):
+    return f"DROP INDEX CONCURRENTLY IF EXISTS {name};"
+
+
+INDEXES = [
+    ("job_embedding_hnsw_idx", "embeddings_jobembedding"),
+    ("resume_embedding_hnsw_idx", "embeddings_resumeembedding"),
+]
+
+
+class Migration(migrations.Migration):
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("embeddings", "0010_hnsw_vector_indexes"),
+    ]
+
+    operations = [
+        # The opclass is tied to the column type, so indexes are rebuilt
+        # around the type change. One statement per RunSQL: CONCURRENTLY
+        # cannot share a multi-statement query either.
+        *[
+            migrations.RunSQL(
+                drop_index(name),
+                reverse_sql=create_index(name, table, "vector_cosine_ops"),
+            )
+            for name, table in INDEXES
+        ],
+        migrations.AlterField(
+            model_name="jobembedding",
+            name="embedding",
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=1536),
+        ),
+        migrations.AlterField(
+            model_name="resumeembedding",
+            name="embedding",
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=1536),
+        ),
+        migrations.AlterField(
+            model_name="embeddingcache",
+            name="embedding",
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=1536),
+        ),
+        *[
+            migrations.RunSQL(
+                create_index(name, table, "halfvec_cosine_ops"),
+                reverse_sql=drop_index(name),
+            )
+            for name, table in INDEXES
+        ],
+    ]
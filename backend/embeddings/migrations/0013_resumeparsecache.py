@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('embeddings', '0012_jobembedding_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeParseCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file_hash', models.CharField(max_length=64)),
+                ('model', models.CharField(max_length=100)),
+                ('raw_text', models.TextField()),
+                ('parsed_data', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('file_hash', 'model')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('embeddings', '0013_resumeparsecache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobresumeinsight',
+            name='job_version',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='jobresumeinsight',
+            name='resume_version',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -1,14 +1,16 @@
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import HalfVectorField
 from jobs.models.job import Job
 from profiles.models import JobSeekerResume, JobSeekerProfile
 
 class JobEmbedding(models.Model):
     job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name="embedding")
     source_text = models.TextField(null=True, blank=True) 
-    embedding = VectorField(dimensions=1536)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    embedding = HalfVectorField(dimensions=1536)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
 
 class ResumeEmbedding(models.Model):
@@ -18,7 +20,8 @@ class ResumeEmbedding(models.Model):
         related_name="embedding"
     )
     source_text = models.TextField(null=True, blank=True) 
-    embedding = VectorField(dimensions=1536)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    embedding = HalfVectorField(dimensions=1536)
 
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -30,7 +33,40 @@ class ResumeEmbedding(models.Model):
         ]
 
 
+class EmbeddingCache(models.Model):
+    """
+    Content-addressed store of provider embeddings.
+    content_hash is sha256 of model name + source text.
+    """
+    content_hash = models.CharField(max_length=64, unique=True)
+    model = models.CharField(max_length=100)
+    embedding = HalfVectorField(dimensions=1536)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
+class ResumeParseCache(models.Model):
+    """
+    Content-addressed store of resume parses.
+    file_hash is sha256 of the uploaded PDF bytes.
+    """
+    file_hash = models.CharField(max_length=64)
+    model = models.CharField(max_length=100)
+    raw_text = models.TextField()
+    parsed_data = models.JSONField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("file_hash", "model")
+
+
 class JobResumeInsight(models.Model):
+    """
+    Shared LLM assessment of a job/resume pair, also used for
+    applications. Versions are hashes of the job text and parsed resume
+    it was generated from; a mismatch means the insight is stale.
+    """
     job = models.ForeignKey(
         Job,
         on_delete=models.CASCADE,
@@ -46,6 +82,9 @@ class JobResumeInsight(models.Model):
     gaps = models.JSONField()
     summary = models.TextField()
 
+    job_version = models.CharField(max_length=64, blank=True, default="")
+    resume_version = models.CharField(max_length=64, blank=True, default="")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from core.redis import get_redis
+from embeddings.backends import get_backend
+from embeddings.services import generate_embedding
+
+logger = logging.getLogger(__name__)
+
+
+KEY_PREFIX = "embeddings:query"
+INDEX_KEY = f"{KEY_PREFIX}:index"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# Shared hit/miss counters are batched per process and written at most
+# this often, so local LRU hits never wait on Redis.
+STATS_FLUSH_INTERVAL = 10
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class QueryEmbeddingCache:
+    """
+    Normalized search query -> embedding vector.
+
+    Lookups go to an in-process LRU first, then Redis, then the
+    provider. Both tiers expire entries after `ttl` seconds and are
+    bounded: the LRU by `local_size`, Redis by `max_entries` (least
+    recently written keys are evicted first).
+    """
+
+    def __init__(self, ttl, local_size, max_entries):
+        self.ttl = ttl
+        self.local_size = local_size
+        self.max_entries = max_entries
+
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+        self._pending = {}
+        self._next_flush = 0.0
+
+    def _key(self, normalized):
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{get_backend().embed_model}:{digest}"
+
+    def _count(self, name, flush=False):
+        """
+        Counts locally. The shared counters get the batch on `flush` (the
+        caller is talking to Redis anyway) or once STATS_FLUSH_INTERVAL
+        has passed.
+        """
+        with self._lock:
+            self._stats[name] += 1
+            self._pending[name] = self._pending.get(name, 0) + 1
+            due = flush or time.monotonic() >= self._next_flush
+
+        if due:
+            self._flush_stats()
+
+    def _flush_stats(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._next_flush = time.monotonic() + STATS_FLUSH_INTERVAL
+
+        if not pending:
+            return
+
+        try:
+            pipe = get_redis().pipeline()
+            for name, count in pending.items():
+                pipe.hincrby(STATS_KEY, name, count)
+            pipe.execute()
+        except RedisError:
+            pass
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+
+            vector, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+
+            self._local.move_to_end(key)
+            return vector
+
+    def _set_local(self, key, vector):
+        with self._lock:
+            self._local[key] = (vector, time.monotonic() + self.ttl)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def _get_redis(self, key):
+        raw = get_redis().get(key)
+        if raw is None:
+            return None
+        return np.frombuffer(raw, dtype=np.float32).tolist()
+
+    def _set_redis(self, key, vector):
+        client = get_redis()
+
+        pipe = client.pipeline()
+        pipe.set(key, np.asarray(vector, dtype=np.float32).tobytes(), ex=self.ttl)
+        now = time.time()
+        pipe.zadd(INDEX_KEY, {key: now})
+        # Members written more than a TTL ago point at expired keys.
+        pipe.zremrangebyscore(INDEX_KEY, "-inf", now - self.ttl)
+        pipe.zcard(INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = [member for member, _ in client.zpopmin(INDEX_KEY, overflow)]
+            if evicted:
+                client.delete(*evicted)
+
+    def get(self, query: str) -> list[float]:
+        normalized = normalize_query(query)
+        key = self._key(normalized)
+
+        vector = self._get_local(key)
+        if vector is not None:
+            self._count("local_hits")
+            return vector
+
+        try:
+            vector = self._get_redis(key)
+        except RedisError:
+            logger.warning("Query embedding cache unavailable, falling back to provider")
+            vector = None
+
+        if vector is not None:
+            self._count("redis_hits", flush=True)
+            self._set_local(key, vector)
+            return vector
+
+        self._count("misses", flush=True)
+        vector = generate_embedding(normalized)
+
+        self._set_local(key, vector)
+        try:
+            self._set_redis(key, vector)
+        except RedisError:
+            logger.warning("Failed to store query embedding in Redis")
+
+        return vector
+
+    def stats(self) -> dict:
+        self._flush_stats()
+
+        with self._lock:
+            local = dict(self._stats, size=len(self._local))
+
+        try:
+            shared = {
+                name.decode(): int(value)
+                for name, value in get_redis().hgetall(STATS_KEY).items()
+            }
+            shared["size"] = get_redis().zcard(INDEX_KEY)
+        except RedisError:
+            shared = None
+
+        return {"process": local, "shared": shared}
+
+
+query_embedding_cache = QueryEmbeddingCache(
+    ttl=settings.QUERY_EMBEDDING_CACHE_TTL,
+    local_size=settings.QUERY_EMBEDDING_CACHE_LOCAL_SIZE,
+    max_entries=settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+)
+
+
+def get_query_embedding(query: str) -> list[float]:
+    return query_embedding_cache.get(query)
@@ -0,0 +1,65 @@
+import math
+import logging
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+PENDING_JOBS_KEY = "embeddings:pending:jobs"
+PENDING_RESUMES_KEY = "embeddings:pending:resumes"
+
+
+def _push(key, ids):
+    """
+    Adds ids to a pending set and returns the new set size.
+    A set keeps repeated saves of the same object down to one entry.
+    """
+    if not ids:
+        return 0
+
+    pipe = get_redis().pipeline()
+    pipe.sadd(key, *ids)
+    pipe.scard(key)
+    _, size = pipe.execute()
+    return size
+
+
+def _pop(key, count):
+    ids = get_redis().spop(key, count) or []
+    return [int(object_id) for object_id in ids]
+
+
+def push_pending_jobs(job_ids):
+    return _push(PENDING_JOBS_KEY, job_ids)
+
+
+def push_pending_resumes(resume_ids):
+    return _push(PENDING_RESUMES_KEY, resume_ids)
+
+
+def pop_pending_jobs(count):
+    return _pop(PENDING_JOBS_KEY, count)
+
+
+def pop_pending_resumes(count):
+    return _pop(PENDING_RESUMES_KEY, count)
+
+
+def pending_size():
+    pipe = get_redis().pipeline()
+    pipe.scard(PENDING_JOBS_KEY)
+    pipe.scard(PENDING_RESUMES_KEY)
+    jobs, resumes = pipe.execute()
+    return max(jobs, resumes)
+
+
+DELAYED_FLUSH_KEY = "embeddings:flush:delayed"
+
+
+def claim_delayed_flush(delay):
+    """
+    Returns True for the caller that may schedule the flush `delay`
+    seconds out; others see it already pending until it is due.
+    """
+    return bool(get_redis().set(DELAYED_FLUSH_KEY, 1, nx=True, ex=max(math.ceil(delay), 1)))
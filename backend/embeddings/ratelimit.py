@@ -0,0 +1,166 @@
+import logging
+import time
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+BUCKET_KEY = "embeddings:ratelimit:{model}"
+COOLDOWN_KEY = "embeddings:ratelimit:{model}:cooldown"
+STRIKES_KEY = "embeddings:ratelimit:{model}:strikes"
+
+# Two token buckets per model (requests and tokens per minute) refilled
+# continuously from the Redis clock. Returns 0 and debits both buckets
+# when the call may go ahead, else the milliseconds to wait. A cooldown
+# set after a 429 blocks everyone until it expires. With force=1 the
+# token cost is debited unconditionally (usage reconciliation).
+_ACQUIRE_SCRIPT = """
+local cooldown = redis.call('PTTL', KEYS[2])
+if ARGV[4] ~= '1' and cooldown > 0 then
+    return cooldown
+end
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local rpm, tpm, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+
+local function level(name, per_minute)
+    local stored = tonumber(redis.call('HGET', KEYS[1], name .. ':level') or per_minute)
+    local updated = tonumber(redis.call('HGET', KEYS[1], name .. ':ts') or now)
+    return math.min(per_minute, stored + (now - updated) * per_minute / 60000)
+end
+
+local requests = rpm > 0 and level('req', rpm) or nil
+local tokens = tpm > 0 and level('tok', tpm) or nil
+
+if ARGV[4] ~= '1' then
+    local wait = 0
+    -- A call larger than the whole budget waits for a full bucket.
+    local needed = math.min(cost, tpm)
+    if requests and requests < 1 then
+        wait = math.max(wait, (1 - requests) * 60000 / rpm)
+    end
+    if tokens and tokens < needed then
+        wait = math.max(wait, (needed - tokens) * 60000 / tpm)
+    end
+    if wait > 0 then
+        return math.ceil(wait)
+    end
+    if requests then
+        redis.call('HSET', KEYS[1], 'req:level', requests - 1, 'req:ts', now)
+    end
+end
+
+if tokens then
+    redis.call('HSET', KEYS[1], 'tok:level', tokens - cost, 'tok:ts', now)
+end
+redis.call('EXPIRE', KEYS[1], 120)
+return 0
+"""
+
+_acquire = None
+
+
+class RateLimited(Exception):
+    """
+    The provider budget for a model is exhausted. Callers should queue
+    the work again after `retry_after` seconds rather than fail.
+    """
+
+    def __init__(self, model, retry_after):
+        self.model = model
+        self.retry_after = retry_after
+        super().__init__(f"Rate limited | model={model} retry_after={retry_after:.1f}s")
+
+
+def estimate_tokens(texts) -> int:
+    # ~4 characters per token for English text; for budgets and reporting.
+    return sum(len(text) for text in texts) // 4
+
+
+def _call(model, tokens, force=False):
+    global _acquire
+
+    limits = settings.AI_RATE_LIMITS.get(model)
+    if not limits:
+        return 0
+
+    if _acquire is None:
+        _acquire = get_redis().register_script(_ACQUIRE_SCRIPT)
+
+    return _acquire(
+        keys=[BUCKET_KEY.format(model=model), COOLDOWN_KEY.format(model=model)],
+        args=[limits.get("rpm", 0), limits.get("tpm", 0), tokens, "1" if force else "0"],
+    )
+
+
+def throttle(model, tokens, max_wait=None):
+    """
+    Takes one request and `tokens` from the model's cluster-wide budget,
+    sleeping up to `max_wait` seconds for capacity. Raises RateLimited
+    when the wait would be longer. Fails open if Redis is unavailable.
+    """
+    if max_wait is None:
+        max_wait = settings.AI_RATE_LIMIT_MAX_WAIT
+
+    deadline = time.monotonic() + max_wait
+
+    while True:
+        try:
+            wait_ms = _call(model, tokens)
+        except RedisError:
+            logger.exception(f"Rate limiter unavailable | model={model}")
+            return
+
+        if not wait_ms:
+            return
+
+        wait = wait_ms / 1000
+        if time.monotonic() + wait > deadline:
+            raise RateLimited(model, wait)
+
+        time.sleep(wait)
+
+
+def report_usage(model, estimated, actual):
+    """
+    Debits tokens the provider reported beyond the estimate taken by
+    throttle(), so the bucket tracks real usage.
+    """
+    if actual <= estimated:
+        return
+
+    try:
+        _call(model, actual - estimated, force=True)
+    except RedisError:
+        logger.exception(f"Rate limiter unavailable | model={model}")
+
+
+def report_rate_limited(model, retry_after=None):
+    """
+    Records a provider 429 and pauses the model for every worker. Uses
+    the provider's Retry-After when given, else backs off exponentially
+    with repeated 429s. Returns the pause in seconds.
+    """
+    try:
+        redis = get_redis()
+        strikes = redis.incr(STRIKES_KEY.format(model=model))
+        redis.expire(STRIKES_KEY.format(model=model), int(settings.AI_RATE_LIMIT_MAX_BACKOFF))
+
+        if retry_after is None:
+            retry_after = min(
+                settings.AI_RATE_LIMIT_BASE_BACKOFF * 2 ** (strikes - 1),
+                settings.AI_RATE_LIMIT_MAX_BACKOFF,
+            )
+
+        redis.set(COOLDOWN_KEY.format(model=model), 1, px=max(int(retry_after * 1000), 1))
+    except RedisError:
+        logger.exception(f"Rate limiter unavailable | model={model}")
+        retry_after = retry_after or settings.AI_RATE_LIMIT_BASE_BACKOFF
+
+    logger.warning(f"Provider rate limited | model={model} pause={retry_after:.1f}s")
+    return retry_after
@@ -0,0 +1,48 @@
+import hashlib
+import logging
+
+from embeddings.backends import get_backend
+from embeddings.models import ResumeParseCache
+
+logger = logging.getLogger(__name__)
+
+
+def compute_file_hash(source) -> str:
+    """
+    sha256 of a resume's bytes. Accepts raw bytes or an uploaded file,
+    which is rewound afterwards so it can still be stored.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return hashlib.sha256(source).hexdigest()
+
+    digest = hashlib.sha256()
+    for chunk in source.chunks():
+        digest.update(chunk)
+    source.seek(0)
+
+    return digest.hexdigest()
+
+
+def get_cached_parse(file_hash):
+    if not file_hash:
+        return None
+
+    return ResumeParseCache.objects.filter(
+        file_hash=file_hash,
+        model=get_backend().completion_model,
+    ).first()
+
+
+def store_parse(file_hash, raw_text, parsed_data):
+    ResumeParseCache.objects.bulk_create(
+        [
+            ResumeParseCache(
+                file_hash=file_hash,
+                model=get_backend().completion_model,
+                raw_text=raw_text,
+                parsed_data=parsed_data,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    logger.info(f"Resume parse cached | file_hash={file_hash}")
@@ -1,13 +1,28 @@
-import os
 import json
+import math
+import multiprocessing
 import re
 import logging
-from openai import OpenAI
+import time
+import billiard
 import fitz  # PyMuPDF
-import re
+from django.conf import settings
+
+from embeddings.backends import get_backend
 
 logger = logging.getLogger(__name__)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+class ResumeTooLargeError(ValueError):
+    """
+    Resume exceeds the configured size or page limits.
+    """
+
+
+class ResumeExtractTimeout(Exception):
+    """
+    Text extraction exceeded RESUME_PAGE_TIMEOUT seconds per page.
+    """
 
 
 def extract_json_from_text(text: str) -> dict:
@@ -55,12 +70,7 @@ Resume text:
 \"\"\"{resume_text}\"\"\"
 """
 
-    response = client.responses.create(
-        model="gpt-4.1-mini",
-        input=prompt,
-    )
-
-    raw_output = response.output_text.strip()
+    raw_output = get_backend().complete(prompt).strip()
 
     logger.info(f"AI resume output:\n{raw_output}")
 
@@ -83,19 +93,101 @@ def clean_resume_text(text: str) -> str:
 
 
 
-def extract_text_from_pdf(file_path: str) -> str:
+def _extract_pages(data: bytes, start: int, stop: int, deadline=None) -> list[str]:
+    doc = fitz.open(stream=data, filetype="pdf")
+    try:
+        text_parts = []
+        for number in range(start, stop):
+            # A single page cannot be interrupted; the deadline stops the
+            # rest of the document once it has passed.
+            if deadline is not None and time.monotonic() > deadline:
+                raise ResumeExtractTimeout(
+                    f"Resume extraction timed out after page {number} of {stop}"
+                )
+            text_parts.append(doc[number].get_text("text"))
+        return text_parts
+    finally:
+        doc.close()
+
+
+def _extract_pages_parallel(data: bytes, page_count: int) -> list[str]:
+    """
+    Extracts page ranges in a bounded process pool. Each range must
+    finish within RESUME_PAGE_TIMEOUT seconds per page, otherwise the
+    pool is killed and ResumeExtractTimeout is raised.
+
+    Uses billiard, which (unlike multiprocessing) may start children from
+    the daemonic processes of a Celery prefork pool.
+    """
+    workers = min(settings.RESUME_EXTRACT_WORKERS, page_count)
+    step = math.ceil(page_count / workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+    pool = billiard.get_context("fork").Pool(processes=len(ranges))
+    try:
+        results = [pool.apply_async(_extract_pages, (data, start, stop)) for start, stop in ranges]
+
+        text_parts = []
+        for (start, stop), result in zip(ranges, results):
+            try:
+                text_parts.extend(
+                    result.get(timeout=(stop - start) * settings.RESUME_PAGE_TIMEOUT)
+                )
+            except multiprocessing.TimeoutError as e:
+                raise ResumeExtractTimeout(
+                    f"Resume pages {start}-{stop} not extracted within "
+                    f"{(stop - start) * settings.RESUME_PAGE_TIMEOUT}s"
+                ) from e
+        return text_parts
+    finally:
+        pool.terminate()
+
+
+def extract_text_from_pdf(source) -> str:
     """
     Extracts readable text from a PDF resume.
     Works well with most resume layouts.
-    """
 
-    doc = fitz.open(file_path)
-
-    text_parts = []
+    `source` is the PDF bytes or a file path. Large documents are
+    split across a process pool.
+    """
 
-    for page in doc:
-        page_text = page.get_text("text")
-        text_parts.append(page_text)
+    if isinstance(source, (bytes, bytearray)):
+        source = bytes(source)
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+
+    try:
+        page_count = doc.page_count
+
+        if page_count > settings.RESUME_MAX_PAGES:
+            raise ResumeTooLargeError(
+                f"Resume has {page_count} pages (limit {settings.RESUME_MAX_PAGES})"
+            )
+
+        parallel = (
+            isinstance(source, bytes)
+            and page_count >= settings.RESUME_PARALLEL_PAGE_THRESHOLD
+        )
+
+        if not parallel:
+            text_parts = [page.get_text("text") for page in doc]
+    finally:
+        doc.close()
+
+    if parallel:
+        try:
+            text_parts = _extract_pages_parallel(source, page_count)
+        except ResumeExtractTimeout:
+            raise
+        except (AssertionError, OSError):
+            logger.warning(
+                f"Parallel PDF extraction unavailable, extracting serially | pages={page_count}",
+                exc_info=True,
+            )
+            deadline = time.monotonic() + page_count * settings.RESUME_PAGE_TIMEOUT
+            text_parts = _extract_pages(source, 0, page_count, deadline=deadline)
 
     raw_text = "\n".join(text_parts)
 
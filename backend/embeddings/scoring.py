@@ -0,0 +1,67 @@
+import logging
+
+from django.db import connection
+
+from applications.models import JobApplication
+from embeddings.models import JobEmbedding, ResumeEmbedding
+from profiles.models import JobSeekerResume
+
+logger = logging.getLogger(__name__)
+
+
+def rescore_applications(job_ids=None, resume_ids=None, application_ids=None):
+    """
+    Recomputes match_score (cosine similarity x 100) in one UPDATE ... FROM
+    for every application of the given jobs, resumes or ids. Applications
+    are scored against their applied resume, or the applicant's default
+    resume if they have none; rows missing either embedding, or already
+    current, are left untouched. Returns the number of rows updated.
+    """
+    scopes = []
+    params = []
+
+    for column, ids in (
+        ("app.job_id", job_ids),
+        ("re.resume_id", resume_ids),
+        ("app.id", application_ids),
+    ):
+        if ids:
+            scopes.append(f"{column} = ANY(%s)")
+            params.append(list(ids))
+
+    if not scopes:
+        return 0
+
+    sql = f"""
+        UPDATE {JobApplication._meta.db_table} AS app
+        SET match_score = ROUND(((1 - (re.embedding <=> je.embedding)) * 100)::numeric, 2)
+        FROM {JobEmbedding._meta.db_table} AS je,
+             {ResumeEmbedding._meta.db_table} AS re
+        WHERE je.job_id = app.job_id
+          AND re.resume_id = COALESCE(
+              app.applied_resume_id,
+              (
+                  SELECT r.id
+                  FROM {JobSeekerResume._meta.db_table} AS r
+                  WHERE r.profile_id = app.applicant_id
+                    AND r.is_default
+                    AND NOT r.is_deleted
+                  ORDER BY r.uploaded_at DESC
+                  LIMIT 1
+              )
+          )
+          AND ({" OR ".join(scopes)})
+          AND app.match_score IS DISTINCT FROM
+              ROUND(((1 - (re.embedding <=> je.embedding)) * 100)::numeric, 2)
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        updated = cursor.rowcount
+
+    logger.info(
+        f"Match scores recomputed | jobs={len(job_ids or [])} "
+        f"resumes={len(resume_ids or [])} applications={len(application_ids or [])} "
+        f"updated={updated}"
+    )
+    return updated
@@ -1,21 +1,70 @@
-from openai import OpenAI
-import os
 import json
+import hashlib
 import logging
+
+from embeddings.backends import get_backend
+from embeddings.models import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+def generate_embedding(text: str) -> list[float]:
+    return generate_embeddings([text])[0]
+
+
+def generate_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Embeds several texts in one API call.
+    Vectors are returned in the same order as `texts`.
+    """
+    if not texts:
+        return []
 
-EMBED_MODEL = "text-embedding-3-small"  # fast + cheap (1536 dims)
+    return get_backend().embed(texts)
 
 
-def generate_embedding(text: str) -> list[float]:
-    response = client.embeddings.create(
-        model=EMBED_MODEL,
-        input=text
+def compute_content_hash(text: str, model: str | None = None) -> str:
+    model = model or get_backend().embed_model
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+def get_or_create_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Returns embeddings for `texts`, reusing EmbeddingCache rows and only
+    sending texts never seen before to the provider.
+    """
+    if not texts:
+        return []
+
+    hashes = [compute_content_hash(text) for text in texts]
+
+    vectors = dict(
+        EmbeddingCache.objects.filter(content_hash__in=hashes)
+        .values_list("content_hash", "embedding")
+    )
+
+    missing = {}
+    for content_hash, text in zip(hashes, texts):
+        if content_hash not in vectors:
+            missing.setdefault(content_hash, text)
+
+    if missing:
+        generated = generate_embeddings(list(missing.values()))
+
+        EmbeddingCache.objects.bulk_create(
+            [
+                EmbeddingCache(content_hash=content_hash, model=get_backend().embed_model, embedding=vector)
+                for content_hash, vector in zip(missing, generated)
+            ],
+            ignore_conflicts=True,
+        )
+        vectors.update(zip(missing, generated))
+
+    logger.info(
+        f"Embedding cache | requested={len(texts)} hits={len(texts) - len(missing)} generated={len(missing)}"
     )
-    return response.data[0].embedding
+
+    return [vectors[content_hash] for content_hash in hashes]
 
 
 def build_job_text(job):
@@ -23,8 +72,9 @@ def build_job_text(job):
     if not job:
         return ""
 
+    # skills.all() so callers can prefetch skills for a batch of jobs
     skills = ", ".join(
-        job.skills.values_list("name", flat=True)
+        skill.name for skill in job.skills.all()
     )
 
     return f"""
@@ -41,7 +91,6 @@ def build_job_text(job):
 
 
 
-import json
 import re
 
 
@@ -94,12 +143,7 @@ Return ONLY valid JSON:
 }}
 """
 
-    response = client.responses.create(
-        model="gpt-4.1-mini",
-        input=prompt
-    )
-
-    raw = response.output_text.strip()
+    raw = get_backend().complete(prompt).strip()
     logger.info(f"AI raw insight output: {raw}")
 
     cleaned = clean_json_output(raw)
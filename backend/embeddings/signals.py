@@ -1,29 +1,75 @@
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from jobs.models.job import Job
 from profiles.models import JobSeekerResume
+from embeddings.insights import invalidate_job_insights, invalidate_resume_insights
 from embeddings.models import JobEmbedding
-from embeddings.tasks import generate_job_embedding_task, generate_resume_embedding_task, notify_matching_candidates_task
+from embeddings.tasks import (
+    notify_matching_candidates_task,
+    rescore_applications_task,
+    schedule_job_embedding,
+    start_resume_pipeline_task,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Job fields that feed build_job_text; saves touching none of them
+# (status flips, view counts) cannot change the embedding.
+JOB_TEXT_FIELDS = {
+    "title",
+    "description",
+    "experience_level",
+    "requirements",
+    "responsibilities",
+    "education_requirement",
+}
+
+
 @receiver(post_save, sender=JobEmbedding)
 def trigger_matching_on_job_embedding(sender, instance, created, **kwargs):
     logger.info("signal triggered for instant job search")
     job_id = instance.job_id
     logger.info(f"Job embedding ready — triggering match | job_id={job_id}")
     notify_matching_candidates_task.delay(job_id)
+    rescore_applications_task.delay(job_ids=[job_id])
+
+
+@receiver(post_save, sender=Job)
+def trigger_embedding(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields and not JOB_TEXT_FIELDS.intersection(update_fields):
+        return
+
+    # on_commit so skills assigned after save are part of the embedded text
+    job_id = instance.id
+    transaction.on_commit(lambda: schedule_job_embedding(job_id))
 
 
 @receiver(post_save, sender=Job)
-def trigger_embedding(sender, instance, created, **kwargs):
-    generate_job_embedding_task.delay(instance.id)
+def invalidate_insights_on_job_change(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields and not JOB_TEXT_FIELDS.intersection(update_fields)):
+        return
+
+    transaction.on_commit(lambda: invalidate_job_insights(instance))
+
+
+@receiver(post_save, sender=JobSeekerResume)
+def invalidate_insights_on_resume_change(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields and "parsed_data" not in update_fields):
+        return
+
+    transaction.on_commit(lambda: invalidate_resume_insights(instance))
 
 
 @receiver(post_save, sender=JobSeekerResume)
 def trigger_resume_embedding(sender, instance, created, **kwargs):
-    if created:
-        generate_resume_embedding_task.delay(instance.id)
+    if not created:
+        return
+
+    # The task reuses an earlier parse of the same file when there is one,
+    # so the request never waits on the cache lookup or the writes.
+    resume_id = instance.id
+    transaction.on_commit(lambda: start_resume_pipeline_task.delay(resume_id))
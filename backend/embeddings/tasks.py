@@ -1,16 +1,49 @@
-from celery import shared_task
+from celery import chain, group, shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
+from redis.exceptions import RedisError
 import time
 import logging
-import os
 
 from jobs.models.job import Job
 from profiles.models import JobSeekerResume
-from embeddings.models import JobEmbedding, ResumeEmbedding
-from embeddings.services import generate_embedding, build_job_text
-from embeddings.resume_parser import extract_text_from_pdf, parse_resume_with_ai, build_candidate_text
-from embeddings.usecases import notify_job_match_sent
+from embeddings.backfill import jobs_needing_embedding, missing_resume_embeddings, stuck_resumes
+from embeddings.insights import (
+    clear_pending,
+    mark_pending,
+    save_application_insight,
+    save_job_resume_insight,
+)
+from embeddings.limits import stage_slot
+from embeddings.matrix import build_job_embedding_snapshot
+from embeddings.metrics import stage_timer
+from embeddings.models import EmbeddingCache, JobEmbedding, ResumeEmbedding
+from embeddings.queue import (
+    claim_delayed_flush,
+    pending_size,
+    pop_pending_jobs,
+    pop_pending_resumes,
+    push_pending_jobs,
+    push_pending_resumes,
+)
+from embeddings.ratelimit import RateLimited, estimate_tokens
+from embeddings.services import (
+    build_job_text,
+    compute_content_hash,
+    get_or_create_embeddings,
+)
+from embeddings.resume_cache import compute_file_hash, get_cached_parse, store_parse
+from embeddings.resume_parser import (
+    ResumeExtractTimeout,
+    ResumeTooLargeError,
+    build_candidate_text,
+    extract_text_from_pdf,
+    parse_resume_with_ai,
+)
+from embeddings.usecases import notify_job_matches_sent
+from embeddings.vector_search import vector_search_profile
 from subscriptions.models import UserSubscription
 
 logger = logging.getLogger(__name__)
@@ -18,6 +51,283 @@ logger = logging.getLogger(__name__)
 import requests
 
 
+def schedule_job_embedding(job_id):
+    """
+    Queues a job for the next batched embedding flush.
+    Falls back to a single-job task if Redis is unavailable.
+    """
+    try:
+        size = push_pending_jobs([job_id])
+    except RedisError:
+        logger.exception(f"Embedding queue unavailable | job_id={job_id}")
+        generate_job_embedding_task.delay(job_id)
+        return
+
+    if size >= settings.EMBEDDING_BATCH_SIZE:
+        flush_embedding_queue_task.delay()
+
+
+def schedule_resume_embedding(resume_id):
+    """
+    Queues a parsed resume for the next batched embedding flush.
+    """
+    size = push_pending_resumes([resume_id])
+
+    if size >= settings.EMBEDDING_BATCH_SIZE:
+        flush_embedding_queue_task.delay()
+
+
+def apply_cached_resume_parse(resume):
+    """
+    Completes a resume from an earlier parse of the same file, reusing the
+    cached embedding when one exists. Returns False on a cache miss.
+    """
+    cached = get_cached_parse(resume.file_hash)
+    if cached is None:
+        return False
+
+    resume.parsed_data = cached.parsed_data
+    resume.status = JobSeekerResume.Status.PARSED
+    resume.parsing_error = None
+    resume.save(update_fields=["parsed_data", "status", "parsing_error"])
+
+    text = build_candidate_text(cached.parsed_data)
+    content_hash = compute_content_hash(text)
+    vector = (
+        EmbeddingCache.objects.filter(content_hash=content_hash)
+        .values_list("embedding", flat=True)
+        .first()
+    )
+
+    if vector is None:
+        schedule_resume_embedding(resume.id)
+    else:
+        ResumeEmbedding.objects.update_or_create(
+            resume=resume,
+            defaults={
+                "embedding": vector,
+                "source_text": text,
+                "content_hash": content_hash,
+            },
+        )
+
+    logger.info(
+        f"Resume parse reused | resume_id={resume.id} | "
+        f"file_hash={resume.file_hash} | embedding_reused={vector is not None}"
+    )
+    return True
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_kwargs={"max_retries": 5},
+    time_limit=settings.EMBEDDING_FLUSH_TIME_LIMIT,
+)
+def flush_embedding_queue_task(self):
+    """
+    Embeds up to EMBEDDING_BATCH_SIZE pending jobs and resumes with one
+    provider call and writes them with one upsert per table.
+    """
+    with stage_slot(
+        "embed",
+        settings.PIPELINE_STAGE_CONCURRENCY["embed"],
+        ttl=settings.EMBEDDING_FLUSH_TIME_LIMIT,
+    ) as acquired:
+        if not acquired:
+            # The running flush (or the next beat tick) drains the queue.
+            logger.info("Embedding flush skipped | embed stage busy")
+            return
+
+        throttled = flush_embedding_queue()
+
+    # A throttled flush already scheduled the next one for when the budget refills.
+    if not throttled and pending_size() >= settings.EMBEDDING_BATCH_SIZE:
+        flush_embedding_queue_task.delay()
+
+
+def flush_embedding_queue():
+    """
+    Embeds one batch from the pending sets. Returns True when the
+    provider budget was exhausted and the batch was put back.
+    """
+    start_time = time.time()
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+
+    job_ids = pop_pending_jobs(batch_size)
+    resume_ids = pop_pending_resumes(batch_size)
+
+    if not job_ids and not resume_ids:
+        return False
+
+    try:
+        result = embed_batch(job_ids, resume_ids)
+    except RateLimited as e:
+        # Not a failure: put the batch back and flush once the budget refills.
+        push_pending_jobs(job_ids)
+        push_pending_resumes(resume_ids)
+
+        # One delayed flush at a time, however many workers hit the limit.
+        if claim_delayed_flush(e.retry_after):
+            flush_embedding_queue_task.apply_async(countdown=e.retry_after)
+
+        logger.info(
+            f"Embedding flush throttled | jobs={len(job_ids)} resumes={len(resume_ids)} "
+            f"retry_after={e.retry_after:.1f}s"
+        )
+        return True
+    except Exception as e:
+        # Put the batch back so a retry (or the next flush) picks it up.
+        push_pending_jobs(job_ids)
+        push_pending_resumes(resume_ids)
+
+        logger.error(
+            f"Embedding flush failed | jobs={len(job_ids)} resumes={len(resume_ids)} error={e}"
+        )
+        raise
+
+    duration = round(time.time() - start_time, 2)
+
+    logger.info(
+        f"Embedding flush completed | jobs={result['jobs']}/{len(job_ids)} "
+        f"resumes={result['resumes']}/{len(resume_ids)} duration_sec={duration}"
+    )
+    return False
+
+
+def embed_batch(job_ids=(), resume_ids=(), notify=True):
+    """
+    Embeds the given jobs and resumes whose source text changed, with one
+    provider call and one upsert per table. Returns counts of changed
+    rows and an estimate of the tokens sent.
+    """
+    jobs = list(
+        Job.objects.filter(id__in=job_ids).prefetch_related("skills")
+    )
+    resumes = list(
+        JobSeekerResume.objects.filter(
+            id__in=resume_ids,
+            parsed_data__isnull=False,
+        )
+    )
+
+    job_texts = [build_job_text(job) for job in jobs]
+    resume_texts = [build_candidate_text(resume.parsed_data) for resume in resumes]
+
+    # Skip rows whose source text (and model) has not changed.
+    job_hashes = dict(
+        JobEmbedding.objects.filter(job__in=jobs)
+        .values_list("job_id", "content_hash")
+    )
+    resume_hashes = dict(
+        ResumeEmbedding.objects.filter(resume__in=resumes)
+        .values_list("resume_id", "content_hash")
+    )
+
+    changed_jobs = []
+    unchanged_job_ids = []
+    for job, text in zip(jobs, job_texts):
+        content_hash = compute_content_hash(text)
+        if job_hashes.get(job.id) != content_hash:
+            changed_jobs.append((job, text, content_hash))
+        else:
+            unchanged_job_ids.append(job.id)
+
+    changed_resumes = []
+    for resume, text in zip(resumes, resume_texts):
+        content_hash = compute_content_hash(text)
+        if resume_hashes.get(resume.id) != content_hash:
+            changed_resumes.append((resume, text, content_hash))
+
+    texts = [text for _, text, _ in changed_jobs] + [text for _, text, _ in changed_resumes]
+    with stage_timer("embed"):
+        vectors = get_or_create_embeddings(texts)
+    job_vectors = vectors[:len(changed_jobs)]
+    resume_vectors = vectors[len(changed_jobs):]
+
+    with stage_timer("upsert"), transaction.atomic():
+        JobEmbedding.objects.bulk_create(
+            [
+                JobEmbedding(job=job, embedding=vector, source_text=text, content_hash=content_hash)
+                for (job, text, content_hash), vector in zip(changed_jobs, job_vectors)
+            ],
+            update_conflicts=True,
+            unique_fields=["job"],
+            update_fields=["embedding", "source_text", "content_hash", "updated_at"],
+        )
+        ResumeEmbedding.objects.bulk_create(
+            [
+                ResumeEmbedding(resume=resume, embedding=vector, source_text=text, content_hash=content_hash)
+                for (resume, text, content_hash), vector in zip(changed_resumes, resume_vectors)
+            ],
+            update_conflicts=True,
+            unique_fields=["resume"],
+            update_fields=["embedding", "source_text", "content_hash", "updated_at"],
+        )
+        # Verified current: stops the reconciler re-queueing jobs whose
+        # saves did not touch the embedded text.
+        JobEmbedding.objects.filter(job_id__in=unchanged_job_ids).update(
+            updated_at=timezone.now()
+        )
+
+    # bulk_create skips post_save, so trigger matching here.
+    if notify:
+        for job, _, _ in changed_jobs:
+            notify_matching_candidates_task.delay(job.id)
+
+    if changed_jobs or changed_resumes:
+        rescore_applications_task.delay(
+            job_ids=[job.id for job, _, _ in changed_jobs],
+            resume_ids=[resume.id for resume, _, _ in changed_resumes],
+        )
+
+    return {
+        "jobs": len(changed_jobs),
+        "resumes": len(changed_resumes),
+        "tokens": estimate_tokens(texts),
+    }
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_kwargs={"max_retries": 3, "countdown": 60},
+)
+def refresh_job_embedding_snapshot_task():
+    """
+    Rebuilds the memory-mapped job embedding matrix used for
+    batch similarity scoring.
+    """
+    rows = build_job_embedding_snapshot()
+    return f"Snapshot written with {rows} jobs"
+
+
+@shared_task
+def reconcile_embeddings_task():
+    """
+    Queues jobs without a current embedding, parsed resumes without one,
+    and restarts stuck resume parses, up to EMBEDDING_RECONCILE_LIMIT of
+    each per run.
+    """
+    limit = settings.EMBEDDING_RECONCILE_LIMIT
+
+    job_ids = list(jobs_needing_embedding().order_by("id").values_list("id", flat=True)[:limit])
+    resume_ids = list(missing_resume_embeddings().order_by("id").values_list("id", flat=True)[:limit])
+    stuck_ids = list(stuck_resumes().order_by("id").values_list("id", flat=True)[:limit])
+
+    push_pending_jobs(job_ids)
+    push_pending_resumes(resume_ids)
+
+    for resume_id in stuck_ids:
+        start_resume_pipeline(resume_id)
+
+    if job_ids or resume_ids:
+        flush_embedding_queue_task.delay()
+
+    return (
+        f"Reconciled | jobs={len(job_ids)} resumes={len(resume_ids)} "
+        f"stuck_resumes={len(stuck_ids)}"
+    )
 
 
 @shared_task(
@@ -38,13 +348,21 @@ def generate_job_embedding_task(self, job_id):
         job = Job.objects.get(id=job_id)
 
         text = build_job_text(job)
+        content_hash = compute_content_hash(text)
 
-        vector = generate_embedding(text)
+        if JobEmbedding.objects.filter(job=job, content_hash=content_hash).exists():
+            logger.info(
+                f"Embedding skipped — text unchanged | job_id={job_id}"
+            )
+            return
 
-        with transaction.atomic():
+        with stage_timer("embed"):
+            vector = get_or_create_embeddings([text])[0]
+
+        with stage_timer("upsert"), transaction.atomic():
             JobEmbedding.objects.update_or_create(
                 job=job,
-                defaults={"embedding": vector, "source_text": text},
+                defaults={"embedding": vector, "source_text": text, "content_hash": content_hash},
             )
 
         duration = round(time.time() - start_time, 2)
@@ -59,6 +377,12 @@ def generate_job_embedding_task(self, job_id):
         )
         return
 
+    except RateLimited:
+        # Hand over to the batched queue, which waits out the budget.
+        logger.info(f"Embedding throttled, queued for batch | job_id={job_id}")
+        schedule_job_embedding(job_id)
+        return
+
     except Exception as e:
         duration = round(time.time() - start_time, 2)
 
@@ -70,53 +394,215 @@ def generate_job_embedding_task(self, job_id):
 
 
 
-def download_resume_to_temp(resume):
+def download_resume(resume) -> bytes:
+    """
+    Streams the resume into memory, aborting once it exceeds
+    RESUME_MAX_BYTES.
+    """
     url = resume.file.url
+    max_bytes = settings.RESUME_MAX_BYTES
 
     logger.info(f"Downloading resume from {url}")
 
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
+    with requests.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+
+        declared = int(response.headers.get("Content-Length") or 0)
+        if declared > max_bytes:
+            raise ResumeTooLargeError(f"Resume is {declared} bytes (limit {max_bytes})")
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.extend(chunk)
+            if len(buffer) > max_bytes:
+                raise ResumeTooLargeError(f"Resume exceeds {max_bytes} bytes")
+
+    logger.info(f"Resume downloaded | bytes={len(buffer)}")
+
+    return bytes(buffer)
+
+def start_resume_pipeline(resume_id):
+    """
+    Runs extract -> parse as a chain; each stage retries on its own and
+    skips work already checkpointed on the resume. Parse hands off to
+    the batched embedding flush.
+    """
+    chain(
+        extract_resume_text_task.si(resume_id),
+        parse_resume_task.si(resume_id),
+    ).apply_async()
+
+
+@shared_task
+def start_resume_pipeline_task(resume_id):
+    """
+    Entry point for a new resume: completes it from the parse cache when
+    the same file was parsed before, otherwise starts the pipeline.
+    """
+    try:
+        resume = JobSeekerResume.objects.get(id=resume_id)
+    except JobSeekerResume.DoesNotExist:
+        logger.warning(f"Resume not found | resume_id={resume_id}")
+        return
+
+    if resume.file_hash and apply_cached_resume_parse(resume):
+        return
+
+    start_resume_pipeline(resume_id)
+
+
+def mark_resume_failed(resume_id, error):
+    try:
+        resume = JobSeekerResume.objects.get(id=resume_id)
+        resume.status = JobSeekerResume.Status.FAILED
+        resume.parsing_error = str(error)
+        resume.save(update_fields=["status", "parsing_error"])
+    except Exception:
+        pass
+
+
+@shared_task
+def generate_resume_embedding_task(resume_id):
+    # Kept so messages queued before the pipeline split still run.
+    start_resume_pipeline(resume_id)
 
-    import tempfile
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    tmp.write(response.content)
-    tmp.close()
 
-    logger.info(f"Resume downloaded to {tmp.name}")
+# A document that is too large or too slow to extract fails the same way
+# on every attempt; retrying would only hold a pdf worker again.
+EXTRACT_PERMANENT_ERRORS = (ResumeTooLargeError, ResumeExtractTimeout, SoftTimeLimitExceeded)
 
-    return tmp.name
 
 @shared_task(
     bind=True,
     autoretry_for=(Exception,),
+    dont_autoretry_for=EXTRACT_PERMANENT_ERRORS,
     retry_backoff=30,
     retry_kwargs={"max_retries": 3},
+    soft_time_limit=settings.RESUME_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.RESUME_TASK_SOFT_TIME_LIMIT + 30,
 )
-def generate_resume_embedding_task(self, resume_id):
+def extract_resume_text_task(self, resume_id):
     start_time = time.time()
     attempt = self.request.retries + 1
 
-    logger.info(
-        f"[START] Resume embedding | resume_id={resume_id} | attempt={attempt}"
-    )
+    with stage_slot(
+        "extract",
+        settings.PIPELINE_STAGE_CONCURRENCY["extract"],
+        ttl=settings.RESUME_TASK_SOFT_TIME_LIMIT + 30,
+    ) as acquired:
+        if not acquired:
+            # Re-queue in place of this task, keeping the rest of the chain
+            # and without spending a retry.
+            raise self.replace(
+                self.si(resume_id).set(countdown=settings.PIPELINE_STAGE_BUSY_COUNTDOWN)
+            )
 
-    try:
-        resume = JobSeekerResume.objects.get(id=resume_id)
+        logger.info(
+            f"[START] Resume extract | resume_id={resume_id} | attempt={attempt}"
+        )
 
-        if resume.status != JobSeekerResume.Status.PARSING:
-            resume.status = JobSeekerResume.Status.PARSING
-            resume.parsing_error = None
-            resume.save(update_fields=["status", "parsing_error"])
+        try:
+            resume = JobSeekerResume.objects.get(id=resume_id)
 
-        temp_path = download_resume_to_temp(resume)
+            if resume.extracted_text or resume.status == JobSeekerResume.Status.PARSED:
+                logger.info(f"[SKIP] Resume already extracted | resume_id={resume_id}")
+                return
+
+            if resume.status != JobSeekerResume.Status.PARSING:
+                resume.status = JobSeekerResume.Status.PARSING
+                resume.parsing_error = None
+                resume.save(update_fields=["status", "parsing_error"])
+
+            with stage_timer("download"):
+                pdf_bytes = download_resume(resume)
+
+            file_hash = compute_file_hash(pdf_bytes)
+            if resume.file_hash != file_hash:
+                resume.file_hash = file_hash
+                resume.save(update_fields=["file_hash"])
+
+            # Completes the resume; the parse stage then skips it.
+            if apply_cached_resume_parse(resume):
+                return
 
-        try:
             logger.info(f"Extracting text | resume_id={resume_id}")
-            raw_text = extract_text_from_pdf(temp_path)
+            with stage_timer("extract"):
+                resume.extracted_text = extract_text_from_pdf(pdf_bytes)
+            resume.save(update_fields=["extracted_text"])
+
+            duration = round(time.time() - start_time, 2)
+
+            logger.info(
+                f"[SUCCESS] Resume extract | resume_id={resume_id} | "
+                f"attempt={attempt} | duration={duration}s"
+            )
+
+        except JobSeekerResume.DoesNotExist:
+            logger.warning(
+                f"[SKIP] Resume deleted before processing | resume_id={resume_id}"
+            )
+            return
+
+        except Exception as e:
+            duration = round(time.time() - start_time, 2)
+
+            logger.error(
+                f"[FAILED] Resume extract | resume_id={resume_id} | "
+                f"attempt={attempt} | duration={duration}s | error={str(e)}"
+            )
+
+            if isinstance(e, EXTRACT_PERMANENT_ERRORS) or self.request.retries >= self.max_retries:
+                mark_resume_failed(resume_id, e)
+
+            raise
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_kwargs={"max_retries": 3},
+    soft_time_limit=settings.RESUME_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.RESUME_TASK_SOFT_TIME_LIMIT + 30,
+)
+def parse_resume_task(self, resume_id):
+    start_time = time.time()
+    attempt = self.request.retries + 1
+
+    with stage_slot(
+        "parse",
+        settings.PIPELINE_STAGE_CONCURRENCY["parse"],
+        ttl=settings.RESUME_TASK_SOFT_TIME_LIMIT + 30,
+    ) as acquired:
+        if not acquired:
+            # Re-queue in place of this task, keeping the rest of the chain
+            # and without spending a retry.
+            raise self.replace(
+                self.si(resume_id).set(countdown=settings.PIPELINE_STAGE_BUSY_COUNTDOWN)
+            )
+
+        logger.info(
+            f"[START] Resume parse | resume_id={resume_id} | attempt={attempt}"
+        )
+
+        try:
+            resume = JobSeekerResume.objects.get(id=resume_id)
+
+            if resume.status != JobSeekerResume.Status.PARSING:
+                logger.info(
+                    f"[SKIP] Resume not awaiting parse | resume_id={resume_id} | status={resume.status}"
+                )
+                return
+
+            if not resume.extracted_text:
+                raise ValueError("Resume has no extracted text")
 
             logger.info(f"Parsing resume with AI | resume_id={resume_id}")
-            parsed = parse_resume_with_ai(raw_text)
+            with stage_timer("parse"):
+                parsed = parse_resume_with_ai(resume.extracted_text)
+
+            if resume.file_hash:
+                store_parse(resume.file_hash, resume.extracted_text, parsed)
 
             resume.parsed_data = parsed
             resume.status = JobSeekerResume.Status.PARSED
@@ -125,56 +611,40 @@ def generate_resume_embedding_task(self, resume_id):
 
             logger.info(f"{parsed=}")
 
-            text = build_candidate_text(parsed)
-
-            logger.info(f"Generating embedding | resume_id={resume_id}")
-            vector = generate_embedding(text)
-
-            with transaction.atomic():
-                ResumeEmbedding.objects.update_or_create(
-                    resume=resume,
-                    defaults={"embedding": vector, "source_text": text},
-                )
+            logger.info(f"Queueing embedding | resume_id={resume_id}")
+            schedule_resume_embedding(resume.id)
 
             duration = round(time.time() - start_time, 2)
 
             logger.info(
-                f"[SUCCESS] Resume embedding completed | resume_id={resume_id} | "
+                f"[SUCCESS] Resume parse | resume_id={resume_id} | "
                 f"attempt={attempt} | duration={duration}s"
             )
 
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                logger.info(f"Temp file cleaned | {temp_path}")
+        except JobSeekerResume.DoesNotExist:
+            logger.warning(
+                f"[SKIP] Resume deleted before parsing | resume_id={resume_id}"
+            )
+            return
 
-    except JobSeekerResume.DoesNotExist:
-        logger.warning(
-            f"[SKIP] Resume deleted before processing | resume_id={resume_id}"
-        )
-        return
+        except RateLimited as e:
+            logger.info(
+                f"[THROTTLED] Resume parse | resume_id={resume_id} | retry_after={e.retry_after:.1f}s"
+            )
+            raise self.replace(self.si(resume_id).set(countdown=e.retry_after))
 
-    except Exception as e:
-        duration = round(time.time() - start_time, 2)
+        except Exception as e:
+            duration = round(time.time() - start_time, 2)
 
-        logger.error(
-            f"[FAILED] Resume embedding | resume_id={resume_id} | "
-            f"attempt={attempt} | duration={duration}s | error={str(e)}"
-        )
+            logger.error(
+                f"[FAILED] Resume parse | resume_id={resume_id} | "
+                f"attempt={attempt} | duration={duration}s | error={str(e)}"
+            )
 
-        # -------------------------------
-        #If Final Retry Failed → Mark FAILED
-        # -------------------------------
-        if self.request.retries >= self.max_retries:
-            try:
-                resume = JobSeekerResume.objects.get(id=resume_id)
-                resume.status = JobSeekerResume.Status.FAILED
-                resume.parsing_error = str(e)
-                resume.save(update_fields=["status", "parsing_error"])
-            except Exception:
-                pass
+            if self.request.retries >= self.max_retries:
+                mark_resume_failed(resume_id, e)
 
-        raise
+            raise
 
 
 @shared_task(
@@ -200,27 +670,14 @@ def generate_resume_embedding_task_after_confirmation(self, resume_id):
             )
             return
 
-        parsed = resume.parsed_data or {}
+        logger.info(f"Queueing embedding | resume_id={resume_id}")
 
-        text = build_candidate_text(parsed)
-
-        logger.info(f"Generating embedding | resume_id={resume_id}")
-
-        vector = generate_embedding(text)
-
-        with transaction.atomic():
-            ResumeEmbedding.objects.update_or_create(
-                resume=resume,
-                defaults={
-                    "embedding": vector,
-                    "source_text": text,
-                },
-            )
+        schedule_resume_embedding(resume.id)
 
         duration = round(time.time() - start_time, 2)
 
         logger.info(
-            f"[SUCCESS] Resume embedding completed | resume_id={resume_id} | "
+            f"[SUCCESS] Resume embedding queued | resume_id={resume_id} | "
             f"attempt={attempt} | duration={duration}s"
         )
 
@@ -245,6 +702,7 @@ def generate_resume_embedding_task_after_confirmation(self, resume_id):
     
 from applications.models import JobApplication
 from pgvector.django import CosineDistance
+from embeddings.scoring import rescore_applications
 
 
 @shared_task(
@@ -255,71 +713,79 @@ from pgvector.django import CosineDistance
 )
 def compute_job_match_task(self, application_id):
 
-    app = JobApplication.objects.get(id=application_id)
-
-    try:
-        job_embedding = JobEmbedding.objects.get(job=app.job).embedding
-    except JobEmbedding.DoesNotExist:
-        logger.warning(f"Job embedding missing | job_id={app.job_id}")
-        raise Exception("Job embedding not ready")
-
-    try:
-        qs = (
-            ResumeEmbedding.objects
-            .filter(resume__profile=app.applicant)
-            .annotate(
-                distance=CosineDistance("embedding", job_embedding)
-            )
-            .values_list("distance", flat=True)
-        )
-        score = qs.first()
-    except ResumeEmbedding.DoesNotExist:
-        logger.warning(f"Resume embedding missing | applicant_id={app.applicant_id}")
-        raise Exception("Resume embedding not ready")
-
-    if score is None:
-        raise Exception("No resume embedding found")
+    rescore_applications(application_ids=[application_id])
 
-    similarity = 1 - score
+    app = JobApplication.objects.only("match_score", "job_id").get(id=application_id)
 
-    app.match_score = round(similarity * 100, 2)
-    app.save(update_fields=["match_score"])
+    if app.match_score is None:
+        logger.warning(f"Embeddings not ready for match | application_id={application_id}")
+        raise Exception("Job or resume embedding not ready")
 
     logger.info(
         f"Match computed | application_id={application_id} | score={app.match_score}"
     )
 
 
-
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_kwargs={"max_retries": 3},
+)
+def rescore_applications_task(job_ids=None, resume_ids=None):
+    """
+    Refreshes match_score for all applications of the given jobs and/or
+    resumes after their embeddings change.
+    """
+    updated = rescore_applications(job_ids=job_ids, resume_ids=resume_ids)
+    return f"Rescored {updated} applications"
 
 
 MATCH_THRESHOLD = 0.65
-MAX_RESULTS = 50   
 
 
-from django.conf import settings
-from notifications.emails.service import send_email_from_payload
+from notifications.emails.service import send_emails_from_payloads
 
 
-def send_job_match_email(email, job, similarity):
+def build_job_match_email(email, job, similarity):
 
     job_url = f"{settings.FRONTEND_URL}/jobs/{job.id}"
     match_percent = round(similarity * 100, 1)
 
-    send_email_from_payload(
-        {
-            "to": email,
-            "subject": f"New job matching your profile: {job.title}",
-            "template": "matching_job_alert",
-            "context": {
-                "job_title": job.title,
-                "match_percent": match_percent,
-                "job_url": job_url,
-                "year": timezone.now().year,
-            },
-        }
+    return {
+        "to": email,
+        "subject": f"New job matching your profile: {job.title}",
+        "template": "matching_job_alert",
+        "context": {
+            "job_title": job.title,
+            "match_percent": match_percent,
+            "job_url": job_url,
+            "year": timezone.now().year,
+        },
+    }
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_kwargs={"max_retries": 5},
+)
+def send_job_match_batch_task(self, job_id, matches):
+    """
+    Emails one chunk of matched candidates over a single SMTP
+    connection, then records their notifications in one bulk insert.
+    `matches` is a list of [user_id, email, similarity].
+    """
+    job = Job.objects.get(id=job_id)
+
+    send_emails_from_payloads(
+        [build_job_match_email(email, job, similarity) for _, email, similarity in matches]
     )
+    notify_job_matches_sent(job, matches)
 
+    logger.info(
+        f"Job match batch sent | job_id={job_id} | count={len(matches)}"
+    )
 
 
 @shared_task(
@@ -345,7 +811,8 @@ def notify_matching_candidates_task(self, job_id):
         plan__plan_type="jobseeker",
     ).values_list("user_id", flat=True)
 
-    matches = (
+    # One query resolves user id and email for the top matches.
+    rows = (
         ResumeEmbedding.objects
         .filter(
             resume__is_default=True,
@@ -354,31 +821,207 @@ def notify_matching_candidates_task(self, job_id):
         .annotate(
             distance=CosineDistance("embedding", job_vector)
         )
-        .order_by("distance")[:MAX_RESULTS]
+        .order_by("distance")
+        .values_list(
+            "resume__profile__user_id",
+            "resume__profile__user__email",
+            "distance",
+        )[:settings.JOB_MATCH_MAX_RESULTS]
+    )
+
+    with vector_search_profile("bulk"):
+        rows = list(rows)
+
+    matches = []
+    for user_id, email, distance in rows:
+        similarity = 1 - distance
+        if similarity < MATCH_THRESHOLD:
+            break
+        matches.append([user_id, email, similarity])
+
+    batch_size = settings.JOB_MATCH_EMAIL_BATCH_SIZE
+    chunks = [matches[i:i + batch_size] for i in range(0, len(matches), batch_size)]
+
+    if chunks:
+        group(
+            send_job_match_batch_task.s(job_id, chunk) for chunk in chunks
+        ).apply_async()
+
+    logger.info(
+        f"Job notifications queued | job_id={job_id} | count={len(matches)} | batches={len(chunks)}"
     )
 
-    logger.info(f"{matches=}")
 
-    notified = 0
+class InsightNotReady(Exception):
+    pass
 
-    for emb in matches:
-        similarity = 1 - emb.distance
 
-        logger.info(f"{similarity=}")
+def schedule_application_insight(application_id):
+    """
+    Queues an ApplicationInsight unless one is already pending.
+    """
+    if mark_pending("application", application_id):
+        generate_application_insight_task.delay(application_id)
 
-        if similarity < MATCH_THRESHOLD:
-            break
 
-        profile = emb.resume.profile
-        user = profile.user
+def schedule_job_resume_insight(job_id, resume_id):
+    """
+    Queues a JobResumeInsight unless one is already pending.
+    """
+    if mark_pending("job-resume", f"{job_id}:{resume_id}"):
+        generate_job_resume_insight_task.delay(job_id, resume_id)
 
-        logger.info(f"{user.email, similarity}")
 
-        send_job_match_email(user.email, job, similarity)
-        notify_job_match_sent(user, job, similarity)
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=15,
+    retry_kwargs={"max_retries": 6},
+)
+def generate_application_insight_task(self, application_id):
+    """
+    Generates the recruiter-facing insight for an application. Waits
+    (via retries) while a freshly uploaded resume is still being parsed.
+    """
+    try:
+        app = (
+            JobApplication.objects
+            .select_related("job", "applied_resume")
+            .get(id=application_id)
+        )
+        resume = app.applied_resume
+
+        if resume is None or resume.status == JobSeekerResume.Status.FAILED:
+            logger.warning(
+                f"[SKIP] Application insight without usable resume | application_id={application_id}"
+            )
+            clear_pending("application", application_id)
+            return
+
+        if not resume.parsed_data:
+            raise InsightNotReady(f"Resume {resume.id} not parsed yet")
+
+        save_application_insight(app)
+        clear_pending("application", application_id)
+
+        logger.info(f"Application insight ready | application_id={application_id}")
+
+    except JobApplication.DoesNotExist:
+        clear_pending("application", application_id)
+        return
+
+    except RateLimited as e:
+        generate_application_insight_task.apply_async((application_id,), countdown=e.retry_after)
+        return
+
+    except Exception as e:
+        logger.error(
+            f"Application insight failed | application_id={application_id} | "
+            f"attempt={self.request.retries + 1} | error={e}"
+        )
+        if self.request.retries >= self.max_retries:
+            clear_pending("application", application_id)
+        raise
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_kwargs={"max_retries": 3},
+)
+def generate_job_resume_insight_task(self, job_id, resume_id):
+    pending_key = f"{job_id}:{resume_id}"
+
+    try:
+        job = Job.objects.get(id=job_id)
+        resume = JobSeekerResume.objects.get(id=resume_id)
+
+        if not resume.parsed_data:
+            logger.warning(
+                f"[SKIP] Job insight for unparsed resume | job_id={job_id} resume_id={resume_id}"
+            )
+            clear_pending("job-resume", pending_key)
+            return
+
+        save_job_resume_insight(job, resume)
+        clear_pending("job-resume", pending_key)
+
+        logger.info(f"Job insight ready | job_id={job_id} resume_id={resume_id}")
+
+    except (Job.DoesNotExist, JobSeekerResume.DoesNotExist):
+        clear_pending("job-resume", pending_key)
+        return
+
+    except RateLimited as e:
+        generate_job_resume_insight_task.apply_async((job_id, resume_id), countdown=e.retry_after)
+        return
+
+    except Exception as e:
+        logger.error(
+            f"Job insight failed | job_id={job_id} resume_id={resume_id} | "
+            f"attempt={self.request.retries + 1} | error={e}"
+        )
+        if self.request.retries >= self.max_retries:
+            clear_pending("job-resume", pending_key)
+        raise
+
+
+@shared_task
+def precompute_job_insights_for_resume_task(resume_id):
+    """
+    Queues insights for the INSIGHT_PRECOMPUTE_TOP_JOBS published jobs
+    closest to a resume that do not have one yet.
+    """
+    try:
+        vector = ResumeEmbedding.objects.get(resume_id=resume_id).embedding
+    except ResumeEmbedding.DoesNotExist:
+        return
+
+    job_ids = (
+        JobEmbedding.objects
+        .filter(job__status=Job.Status.PUBLISHED, job__is_active=True)
+        .exclude(job__resume_insights__resume_id=resume_id)
+        .annotate(distance=CosineDistance("embedding", vector))
+        .order_by("distance")
+        .values_list("job_id", flat=True)[:settings.INSIGHT_PRECOMPUTE_TOP_JOBS]
+    )
+
+    with vector_search_profile("interactive"):
+        job_ids = list(job_ids)
 
-        notified += 1
+    for job_id in job_ids:
+        schedule_job_resume_insight(job_id, resume_id)
 
     logger.info(
-        f"Job notifications sent | job_id={job_id} | count={notified}"
+        f"Job insights queued | resume_id={resume_id} | count={len(job_ids)}"
+    )
+
+
+@shared_task
+def precompute_premium_job_insights_task():
+    """
+    Fans out insight precomputation for every active premium
+    jobseeker's default resume.
+    """
+    active_subscriber_ids = UserSubscription.objects.filter(
+        status="active",
+        end_date__gt=timezone.now(),
+        plan__plan_type="jobseeker",
+    ).values_list("user_id", flat=True)
+
+    resume_ids = list(
+        ResumeEmbedding.objects.filter(
+            resume__is_default=True,
+            resume__is_deleted=False,
+            resume__profile__user_id__in=active_subscriber_ids,
+        ).values_list("resume_id", flat=True)
     )
+
+    if resume_ids:
+        group(
+            precompute_job_insights_for_resume_task.s(resume_id)
+            for resume_id in resume_ids
+        ).apply_async()
+
+    return f"Insight precompute queued for {len(resume_ids)} resumes"
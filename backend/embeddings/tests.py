@@ -1,3 +1,262 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+from redis.exceptions import RedisError
+
+from embeddings import ratelimit
+from embeddings.models import ResumeParseCache
+from embeddings.query_cache import INDEX_KEY, STATS_KEY, QueryEmbeddingCache
+from embeddings.ratelimit import RateLimited, report_rate_limited, report_usage, throttle
+from embeddings.resume_parser import build_candidate_text
+from embeddings.services import compute_content_hash
+from embeddings.tasks import (
+    apply_cached_resume_parse,
+    flush_embedding_queue,
+    flush_embedding_queue_task,
+    start_resume_pipeline_task,
+)
+from profiles.models import JobSeekerResume
+
+
+@override_settings(
+    AI_RATE_LIMITS={"text-embedding-3-small": {"rpm": 60, "tpm": 1000}},
+    AI_RATE_LIMIT_BASE_BACKOFF=2,
+    AI_RATE_LIMIT_MAX_BACKOFF=10,
+)
+class ThrottleTests(SimpleTestCase):
+    model = "text-embedding-3-small"
+
+    def setUp(self):
+        call = mock.patch("embeddings.ratelimit._call")
+        sleep = mock.patch("embeddings.ratelimit.time.sleep")
+        self.call = call.start()
+        self.sleep = sleep.start()
+        self.addCleanup(call.stop)
+        self.addCleanup(sleep.stop)
+
+    def test_goes_ahead_when_budget_left(self):
+        self.call.return_value = 0
+
+        throttle(self.model, 100, max_wait=2)
+
+        self.call.assert_called_once_with(self.model, 100)
+        self.sleep.assert_not_called()
+
+    def test_waits_for_capacity_within_max_wait(self):
+        self.call.side_effect = [500, 0]
+
+        throttle(self.model, 100, max_wait=2)
+
+        self.sleep.assert_called_once_with(0.5)
+        self.assertEqual(self.call.call_count, 2)
+
+    def test_raises_when_wait_exceeds_max_wait(self):
+        self.call.return_value = 5000
+
+        with self.assertRaises(RateLimited) as raised:
+            throttle(self.model, 100, max_wait=2)
+
+        self.assertEqual(raised.exception.retry_after, 5.0)
+        self.assertEqual(raised.exception.model, self.model)
+        self.sleep.assert_not_called()
+
+    def test_fails_open_without_redis(self):
+        self.call.side_effect = RedisError("down")
+
+        with self.assertLogs("embeddings.ratelimit", "ERROR"):
+            throttle(self.model, 100, max_wait=2)
+
+    def test_usage_debits_only_the_overshoot(self):
+        report_usage(self.model, estimated=100, actual=80)
+        self.call.assert_not_called()
+
+        report_usage(self.model, estimated=100, actual=250)
+        self.call.assert_called_once_with(self.model, 150, force=True)
+
+    def test_repeated_429s_back_off_exponentially(self):
+        redis = mock.Mock()
+        redis.incr.side_effect = [1, 2, 3, 4]
+
+        with mock.patch("embeddings.ratelimit.get_redis", return_value=redis), \
+                self.assertLogs("embeddings.ratelimit", "WARNING"):
+            pauses = [report_rate_limited(self.model) for _ in range(4)]
+
+        self.assertEqual(pauses, [2, 4, 8, 10])
+        redis.set.assert_called_with(ratelimit.COOLDOWN_KEY.format(model=self.model), 1, px=10_000)
+
+    def test_retry_after_from_provider_wins(self):
+        redis = mock.Mock()
+        redis.incr.return_value = 5
+
+        with mock.patch("embeddings.ratelimit.get_redis", return_value=redis), \
+                self.assertLogs("embeddings.ratelimit", "WARNING"):
+            self.assertEqual(report_rate_limited(self.model, retry_after=1.5), 1.5)
+
+
+@override_settings(EMBEDDING_BATCH_SIZE=2)
+class ThrottledFlushTests(SimpleTestCase):
+    def setUp(self):
+        patches = {
+            "pop_jobs": mock.patch("embeddings.tasks.pop_pending_jobs", return_value=[1, 2]),
+            "pop_resumes": mock.patch("embeddings.tasks.pop_pending_resumes", return_value=[]),
+            "push_jobs": mock.patch("embeddings.tasks.push_pending_jobs"),
+            "push_resumes": mock.patch("embeddings.tasks.push_pending_resumes"),
+            "embed": mock.patch(
+                "embeddings.tasks.embed_batch",
+                side_effect=RateLimited("text-embedding-3-small", 3.0),
+            ),
+            "claim": mock.patch("embeddings.tasks.claim_delayed_flush", return_value=True),
+            "schedule": mock.patch.object(flush_embedding_queue_task, "apply_async"),
+        }
+        self.mocks = {name: patch.start() for name, patch in patches.items()}
+        for patch in patches.values():
+            self.addCleanup(patch.stop)
+
+    def test_batch_put_back_and_one_flush_scheduled(self):
+        self.assertTrue(flush_embedding_queue())
+
+        self.mocks["push_jobs"].assert_called_once_with([1, 2])
+        self.mocks["claim"].assert_called_once_with(3.0)
+        self.mocks["schedule"].assert_called_once_with(countdown=3.0)
+
+    def test_no_second_flush_while_one_is_pending(self):
+        self.mocks["claim"].return_value = False
+
+        self.assertTrue(flush_embedding_queue())
+
+        self.mocks["schedule"].assert_not_called()
+
+
+@override_settings(AI_BACKEND="local")
+class ResumeParseCacheHitTests(SimpleTestCase):
+    parsed_data = {
+        "role": "Backend Developer",
+        "skills": ["Python", "Django"],
+        "experience_level": "mid",
+    }
+
+    def setUp(self):
+        self.resume = JobSeekerResume(id=5, file_hash="a" * 64, status=JobSeekerResume.Status.UPLOADED)
+
+        patches = {
+            # Content hashes are keyed by the embed model; load the offline
+            # backend for this test and restore the process-wide one after.
+            "backend": mock.patch("embeddings.backends._backend", None),
+            "save": mock.patch.object(self.resume, "save"),
+            "cached": mock.patch("embeddings.tasks.get_cached_parse"),
+            "vectors": mock.patch("embeddings.tasks.EmbeddingCache.objects"),
+            "resume_embeddings": mock.patch("embeddings.tasks.ResumeEmbedding.objects"),
+            "schedule": mock.patch("embeddings.tasks.schedule_resume_embedding"),
+        }
+        self.mocks = {name: patch.start() for name, patch in patches.items()}
+        for patch in patches.values():
+            self.addCleanup(patch.stop)
+
+        self.mocks["cached"].return_value = ResumeParseCache(
+            file_hash=self.resume.file_hash,
+            parsed_data=self.parsed_data,
+        )
+        self.cached_vector = self.mocks["vectors"].filter.return_value.values_list.return_value.first
+
+    def test_miss_leaves_resume_alone(self):
+        self.mocks["cached"].return_value = None
+
+        self.assertFalse(apply_cached_resume_parse(self.resume))
+
+        self.mocks["save"].assert_not_called()
+        self.mocks["resume_embeddings"].update_or_create.assert_not_called()
+
+    def test_hit_completes_resume_and_reuses_embedding(self):
+        self.cached_vector.return_value = [0.1] * 1536
+
+        self.assertTrue(apply_cached_resume_parse(self.resume))
+
+        self.assertEqual(self.resume.parsed_data, self.parsed_data)
+        self.assertEqual(self.resume.status, JobSeekerResume.Status.PARSED)
+        self.mocks["save"].assert_called_once_with(update_fields=["parsed_data", "status", "parsing_error"])
+
+        text = build_candidate_text(self.parsed_data)
+        self.mocks["vectors"].filter.assert_called_once_with(content_hash=compute_content_hash(text))
+        self.mocks["resume_embeddings"].update_or_create.assert_called_once_with(
+            resume=self.resume,
+            defaults={
+                "embedding": [0.1] * 1536,
+                "source_text": text,
+                "content_hash": compute_content_hash(text),
+            },
+        )
+        self.mocks["schedule"].assert_not_called()
+
+    def test_hit_without_vector_queues_embedding(self):
+        self.cached_vector.return_value = None
+
+        self.assertTrue(apply_cached_resume_parse(self.resume))
+
+        self.mocks["schedule"].assert_called_once_with(self.resume.id)
+        self.mocks["resume_embeddings"].update_or_create.assert_not_called()
+
+    def test_task_skips_pipeline_on_hit(self):
+        self.cached_vector.return_value = [0.1] * 1536
+
+        with mock.patch("embeddings.tasks.JobSeekerResume.objects") as resumes, \
+                mock.patch("embeddings.tasks.start_resume_pipeline") as pipeline:
+            resumes.get.return_value = self.resume
+            start_resume_pipeline_task(self.resume.id)
+
+        pipeline.assert_not_called()
+
+    def test_task_starts_pipeline_on_miss(self):
+        self.mocks["cached"].return_value = None
+
+        with mock.patch("embeddings.tasks.JobSeekerResume.objects") as resumes, \
+                mock.patch("embeddings.tasks.start_resume_pipeline") as pipeline:
+            resumes.get.return_value = self.resume
+            start_resume_pipeline_task(self.resume.id)
+
+        pipeline.assert_called_once_with(self.resume.id)
+
+
+class QueryEmbeddingCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = mock.MagicMock()
+        self.redis.get.return_value = None
+        self.pipe = self.redis.pipeline.return_value
+        self.pipe.execute.return_value = [True, 1, 0, 1]
+
+        patches = [
+            mock.patch("embeddings.query_cache.get_redis", return_value=self.redis),
+            mock.patch("embeddings.query_cache.get_backend", return_value=mock.Mock(embed_model="test-embed")),
+            mock.patch("embeddings.query_cache.generate_embedding", return_value=[0.5, 0.25]),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.cache = QueryEmbeddingCache(ttl=60, local_size=10, max_entries=100)
+
+    def test_local_hits_do_not_touch_redis(self):
+        self.cache.get("Python  Developer")
+        self.redis.reset_mock()
+
+        for _ in range(5):
+            self.assertEqual(self.cache.get("python developer"), [0.5, 0.25])
+
+        self.redis.pipeline.assert_not_called()
+        self.redis.get.assert_not_called()
+        self.assertEqual(self.cache.stats()["process"]["local_hits"], 5)
+
+    def test_batched_counters_flushed_with_stats(self):
+        self.cache.get("python developer")
+        for _ in range(3):
+            self.cache.get("python developer")
+        self.pipe.reset_mock()
+
+        self.cache.stats()
+
+        self.pipe.hincrby.assert_called_once_with(STATS_KEY, "local_hits", 3)
+
+    def test_write_prunes_index_entries_older_than_ttl(self):
+        with mock.patch("embeddings.query_cache.time.time", return_value=1000.0):
+            self.cache.get("python developer")
+
+        self.pipe.zremrangebyscore.assert_called_once_with(INDEX_KEY, "-inf", 940.0)
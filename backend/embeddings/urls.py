@@ -1,10 +1,15 @@
 
 
 from django.urls import path
-from .views import JobCreateWithEmbeddingAPIView, SemanticJobSearchAPIView
+from .views import (
+    JobCreateWithEmbeddingAPIView,
+    QueryEmbeddingCacheStatsAPIView,
+    SemanticJobSearchAPIView,
+)
 app_name = "embeddings" 
 
 urlpatterns = [
     path("jobs/create/", JobCreateWithEmbeddingAPIView.as_view()),
     path("jobs/search/", SemanticJobSearchAPIView.as_view()),
+    path("jobs/search/cache-stats/", QueryEmbeddingCacheStatsAPIView.as_view()),
 ]
@@ -9,46 +9,57 @@ logger = logging.getLogger(__name__)
 
 
 def notify_job_match_sent(user, job, similarity):
-    admins = get_admin_users()
+    notify_job_matches_sent(job, [(user.id, user.email, similarity)])
 
-    similarity_pct = round(similarity * 100, 1)
 
-    data_list = [
+def notify_job_matches_sent(job, matches):
+    """
+    Creates candidate and admin notifications for a chunk of matches
+    in one bulk insert. `matches` is a list of (user_id, email, similarity).
+    """
+    admins = list(get_admin_users())
+
+    data_list = []
+
+    for user_id, email, similarity in matches:
+        similarity_pct = round(similarity * 100, 1)
+
         #  Candidate notification
-        {
-            "user": user,
-            "user_role": RoleChoices.JOBSEEKER,
-            "title": "New Job Match Found",
-            "message": (
-                f"A job matching your profile ({similarity_pct}% match) "
-                f"is available: {job.title}"
-            ),
-            "type": TypeChoices.JOB_MATCH_FOUND,
-            "related_id": job.id,
-        }
-    ]
-
-    #  Admin notifications
-    for admin in admins:
         data_list.append(
             {
-                "user": admin,
-                "user_role": RoleChoices.ADMIN,
-                "title": "Job Match Email Sent",
+                "user_id": user_id,
+                "user_role": RoleChoices.JOBSEEKER,
+                "title": "New Job Match Found",
                 "message": (
-                    f"Job match email sent to {user.email} "
-                    f"for job '{job.title}' ({similarity_pct}% match)."
+                    f"A job matching your profile ({similarity_pct}% match) "
+                    f"is available: {job.title}"
                 ),
-                "type": TypeChoices.JOB_MATCH_SENT,
+                "type": TypeChoices.JOB_MATCH_FOUND,
                 "related_id": job.id,
             }
         )
 
+        #  Admin notifications
+        for admin in admins:
+            data_list.append(
+                {
+                    "user": admin,
+                    "user_role": RoleChoices.ADMIN,
+                    "title": "Job Match Email Sent",
+                    "message": (
+                        f"Job match email sent to {email} "
+                        f"for job '{job.title}' ({similarity_pct}% match)."
+                    ),
+                    "type": TypeChoices.JOB_MATCH_SENT,
+                    "related_id": job.id,
+                }
+            )
+
     try:
         bulk_create_notifications(data_list)
     except Exception:
         logger.exception(
-            "Failed to create job match notifications | job_id=%s user_id=%s",
+            "Failed to create job match notifications | job_id=%s users=%s",
             job.id,
-            user.id
+            len(matches)
         )
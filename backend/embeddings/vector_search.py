@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, transaction
+
+
+# ANN indexes maintained by the embeddings migrations.
+VECTOR_INDEXES = [
+    "job_embedding_hnsw_idx",
+    "resume_embedding_hnsw_idx",
+]
+
+
+@contextmanager
+def vector_search_profile(name):
+    """
+    Applies the index knobs of a VECTOR_SEARCH_PROFILES entry
+    (hnsw.ef_search) for the duration of the block.
+
+    Settings are transaction-local, so querysets must be evaluated
+    inside the block.
+    """
+    params = settings.VECTOR_SEARCH_PROFILES[name]
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for setting_name, value in params.items():
+                cursor.execute(
+                    "SELECT set_config(%s, %s, true)",
+                    [setting_name, str(value)],
+                )
+        yield
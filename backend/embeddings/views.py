@@ -2,9 +2,13 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from core.permissions import IsAdmin
 from jobs.models.job import Job
 from embeddings.models import JobEmbedding
+from embeddings.query_cache import get_query_embedding, query_embedding_cache
+from embeddings.ratelimit import RateLimited
 from embeddings.services import generate_embedding, build_job_text
+from embeddings.vector_search import vector_search_profile
 
 
 
@@ -23,12 +27,18 @@ class SemanticJobSearchAPIView(APIView):
         query_text = request.data["query"]
         logger.info(f"{query_text=}")
 
-        query_vector = generate_embedding(query_text)
-
-        logger.info(f"{query_vector=}")
+        try:
+            query_vector = get_query_embedding(query_text)
+        except RateLimited as e:
+            return Response(
+                {"detail": "Search is busy, please retry shortly."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(int(e.retry_after) + 1)},
+            )
 
         
 
+        # Order by raw distance so the HNSW index can serve the scan.
         matches = (
             JobEmbedding.objects
             .annotate(
@@ -38,21 +48,25 @@ class SemanticJobSearchAPIView(APIView):
                     output_field=FloatField()
                 ),
             )
-            .order_by("-similarity")[:10]
+            .order_by("distance")[:10]
         )
 
-        logger.info(f"{matches=}")
+        with vector_search_profile("interactive"):
+            results = [
+                {
+                    "match_percent": round(m.similarity * 100, 2),
+                }
+                for m in matches
+            ]
 
+        return Response({"results": results})
 
 
-        results = [
-            {
-                "match_percent": round(m.similarity * 100, 2),
-            }
-            for m in matches
-        ]
+class QueryEmbeddingCacheStatsAPIView(APIView):
+    permission_classes = [IsAdmin]
 
-        return Response({"results": results})
+    def get(self, request):
+        return Response(query_embedding_cache.stats())
 
 
 class JobCreateWithEmbeddingAPIView(APIView):
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import connection
+from redis.exceptions import RedisError
+
+from core.redis import get_redis
+from jobs.models.job import Job
+from jobs.models.skill import JobSkill
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_KEY = "jobs:facets:{digest}"
+
+# Query params that change the page, not the matching set. Facets count
+# lexical matches whatever the search mode.
+IGNORED_PARAMS = {"page", "page_size", "cursor", "pagination", "count", "ordering", "mode"}
+
+# (label, lower bound inclusive, upper bound exclusive) in INR per year,
+# on salary_max falling back to salary_min.
+SALARY_BUCKETS = (
+    ("0-3L", 0, 300_000),
+    ("3-6L", 300_000, 600_000),
+    ("6-10L", 600_000, 1_000_000),
+    ("10-20L", 1_000_000, 2_000_000),
+    ("20L+", 2_000_000, None),
+)
+
+FACETS = ("job_type", "work_mode", "experience_level", "location_city", "salary", "skills")
+
+
+def facet_cache_key(query_params):
+    """
+    Cache key for the filter set in `query_params`: paging params
+    dropped, keys sorted, blank values ignored.
+    """
+    items = sorted(
+        (key, value.strip())
+        for key in query_params
+        if key not in IGNORED_PARAMS
+        for value in query_params.getlist(key)
+        if value.strip()
+    )
+    digest = hashlib.sha256(urlencode(items).encode("utf-8")).hexdigest()
+    return CACHE_KEY.format(digest=digest)
+
+
+def _salary_bucket_sql():
+    cases = []
+    params = []
+
+    for label, low, high in SALARY_BUCKETS:
+        if high is None:
+            cases.append("WHEN COALESCE(j.salary_max, j.salary_min) >= %s THEN %s")
+            params.extend([low, label])
+        else:
+            cases.append("WHEN COALESCE(j.salary_max, j.salary_min) >= %s AND COALESCE(j.salary_max, j.salary_min) < %s THEN %s")
+            params.extend([low, high, label])
+
+    return f"CASE {' '.join(cases)} END", params
+
+
+def job_facets(queryset, top=None):
+    """
+    Counts the jobs of `queryset` by job type, work mode, experience
+    level, city, salary bucket and skill in one GROUPING SETS query.
+    Cities and skills are limited to the `top` most frequent values.
+    """
+    top = top or settings.JOB_FACETS_TOP_VALUES
+
+    base_sql, base_params = queryset.order_by().values("id").query.sql_with_params()
+    bucket_sql, bucket_params = _salary_bucket_sql()
+
+    sql = f"""
+        WITH matched AS ({base_sql}),
+        facet_rows AS (
+            SELECT
+                j.id,
+                j.job_type,
+                j.work_mode,
+                j.experience_level,
+                j.location_city,
+                {bucket_sql} AS salary,
+                s.name AS skill
+            FROM {Job._meta.db_table} AS j
+            JOIN matched ON matched.id = j.id
+            LEFT JOIN {Job.skills.through._meta.db_table} AS js ON js.job_id = j.id
+            LEFT JOIN {JobSkill._meta.db_table} AS s ON s.id = js.jobskill_id
+        )
+        SELECT
+            CASE
+                WHEN GROUPING(job_type) = 0 THEN 'job_type'
+                WHEN GROUPING(work_mode) = 0 THEN 'work_mode'
+                WHEN GROUPING(experience_level) = 0 THEN 'experience_level'
+                WHEN GROUPING(location_city) = 0 THEN 'location_city'
+                WHEN GROUPING(salary) = 0 THEN 'salary'
+                ELSE 'skills'
+            END AS facet,
+            COALESCE(job_type, work_mode, experience_level, location_city, salary, skill) AS value,
+            COUNT(DISTINCT id) AS total
+        FROM facet_rows
+        GROUP BY GROUPING SETS (
+            (job_type), (work_mode), (experience_level), (location_city), (salary), (skill)
+        )
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (*base_params, *bucket_params))
+        rows = cursor.fetchall()
+
+    facets = {name: [] for name in FACETS}
+    for facet, value, total in rows:
+        if value is not None:
+            facets[facet].append({"value": value, "count": total})
+
+    for name, values in facets.items():
+        values.sort(key=lambda item: (-item["count"], item["value"]))
+        if name in ("location_city", "skills"):
+            del values[top:]
+
+    bounds = {label: (low, high) for label, low, high in SALARY_BUCKETS}
+    facets["salary"] = [
+        {**item, "min": bounds[item["value"]][0], "max": bounds[item["value"]][1]}
+        for item in sorted(facets["salary"], key=lambda item: bounds[item["value"]][0])
+    ]
+
+    return facets
+
+
+def get_cached_facets(key):
+    try:
+        cached = get_redis().get(key)
+    except RedisError:
+        logger.exception("Job facet cache unavailable")
+        return None
+    return json.loads(cached) if cached else None
+
+
+def store_facets(key, facets):
+    try:
+        get_redis().set(key, json.dumps(facets), ex=settings.JOB_FACETS_CACHE_TTL)
+    except RedisError:
+        logger.exception("Job facet cache unavailable")
@@ -0,0 +1,79 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Max, Min
+
+from jobs.models.job import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild every job's weighted search_vector in parallel id-range "
+        "chunks. Each chunk commits on its own, so the table is never "
+        "locked as a whole and an interrupted run can simply be repeated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Job ids per UPDATE.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Chunks updated at once, each on its own connection.",
+        )
+
+    def handle(self, *args, **options):
+        bounds = Job.objects.aggregate(low=Min("id"), high=Max("id"))
+        if bounds["low"] is None:
+            self.stdout.write("No jobs to reindex")
+            return
+
+        chunk_size = max(options["chunk_size"], 1)
+        ranges = [
+            (start, start + chunk_size)
+            for start in range(bounds["low"], bounds["high"] + 1, chunk_size)
+        ]
+
+        started = time.monotonic()
+        updated = 0
+
+        with ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as pool:
+            futures = [pool.submit(self.reindex, start, stop) for start, stop in ranges]
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                updated += future.result()
+                if done % 10 == 0 or done == len(futures):
+                    self.stdout.write(f"{done}/{len(futures)} chunks | {updated} jobs")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Reindexed {updated} jobs in {elapsed:.1f}s")
+        )
+
+    def reindex(self, start, stop):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE jobs_job
+                    SET search_vector = build_job_search_vector(
+                        title,
+                        job_skill_names(id),
+                        requirements,
+                        description
+                    )
+                    WHERE id >= %s AND id < %s
+                    """,
+                    [start, stop],
+                )
+                return cursor.rowcount
+        finally:
+            # Worker threads hold their own connections.
+            connection.close()
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_application_deadline_job_education_requirement_and_more'),
+        ('recruiter', '0004_recruiterprofile_can_post_jobs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'published')), fields=['-published_at', '-id'], name='job_public_feed_idx'),
+        ),
+    ]
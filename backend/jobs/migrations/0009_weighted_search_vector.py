@@ -0,0 +1,217 @@
+from importlib import import_module
+
+from django.db import migrations
+
+
+# Restored on reverse.
+PREVIOUS_TRIGGERS_SQL = import_module(
+    "jobs.migrations.0003_add_search_triggers"
+).Migration.operations[0].sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_public_feed_idx'),
+    ]
+
+
+    operations = [
+        migrations.RunSQL(
+            # ======================= FORWARD =======================
+            """
+            DROP TRIGGER IF EXISTS job_search_vector_after_skill_change ON jobs_job_skills;
+            DROP TRIGGER IF EXISTS job_search_vector_before_save ON jobs_job;
+
+            DROP FUNCTION IF EXISTS job_skill_after_change();
+            DROP FUNCTION IF EXISTS job_before_save_search_vector();
+            DROP FUNCTION IF EXISTS build_job_vector_from_fields(TEXT, TEXT);
+
+
+            /*
+            ---------------------------------------------------------
+            1. Weighted document
+               - A: title
+               - B: skills
+               - C: requirements + description
+            ---------------------------------------------------------
+            */
+            CREATE OR REPLACE FUNCTION build_job_search_vector(
+                job_title TEXT,
+                skill_names TEXT,
+                job_requirements TEXT,
+                job_description TEXT
+            )
+            RETURNS tsvector AS $$
+                SELECT
+                    setweight(to_tsvector('english', COALESCE(job_title, '')), 'A') ||
+                    setweight(to_tsvector('english', COALESCE(skill_names, '')), 'B') ||
+                    setweight(
+                        to_tsvector(
+                            'english',
+                            COALESCE(job_requirements, '') || ' ' ||
+                            COALESCE(job_description, '')
+                        ),
+                        'C'
+                    );
+            $$ LANGUAGE sql IMMUTABLE;
+
+
+            CREATE OR REPLACE FUNCTION job_skill_names(target_job_id BIGINT)
+            RETURNS TEXT AS $$
+                SELECT string_agg(s.name, ' ')
+                FROM jobs_job_skills jjs
+                JOIN jobs_jobskill s ON s.id = jjs.jobskill_id
+                WHERE jjs.job_id = target_job_id;
+            $$ LANGUAGE sql STABLE;
+
+
+            /*
+            ---------------------------------------------------------
+            2. Recompute for a set of jobs, one UPDATE per call
+               - Touches only search_vector, so the BEFORE UPDATE
+                 trigger below does not fire again
+            ---------------------------------------------------------
+            */
+            CREATE OR REPLACE FUNCTION refresh_job_search_vectors(job_ids BIGINT[])
+            RETURNS void AS $$
+                UPDATE jobs_job
+                SET search_vector = build_job_search_vector(
+                    title,
+                    job_skill_names(id),
+                    requirements,
+                    description
+                )
+                WHERE id = ANY(job_ids);
+            $$ LANGUAGE sql;
+
+
+            /*
+            ---------------------------------------------------------
+            3. BEFORE INSERT/UPDATE on jobs_job
+               - Row data plus a read of the job's skills
+               - Updates fire only when a searched column changed
+            ---------------------------------------------------------
+            */
+            CREATE OR REPLACE FUNCTION job_before_save_search_vector()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.search_vector := build_job_search_vector(
+                    NEW.title,
+                    job_skill_names(NEW.id),
+                    NEW.requirements,
+                    NEW.description
+                );
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+
+            /*
+            ---------------------------------------------------------
+            4. Statement-level triggers on the M2M and skill names
+               - Transition tables give every affected job at once,
+                 so a bulk skills.set() updates each job once
+               - Postgres allows one event per transition-table trigger
+            ---------------------------------------------------------
+            */
+            CREATE OR REPLACE FUNCTION job_skills_after_insert()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                PERFORM refresh_job_search_vectors(
+                    ARRAY(SELECT DISTINCT job_id FROM inserted_job_skills)
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION job_skills_after_delete()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                PERFORM refresh_job_search_vectors(
+                    ARRAY(SELECT DISTINCT job_id FROM deleted_job_skills)
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION job_skill_after_rename()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                PERFORM refresh_job_search_vectors(
+                    ARRAY(
+                        SELECT DISTINCT jjs.job_id
+                        FROM renamed_skills r
+                        JOIN previous_skills p ON p.id = r.id
+                        JOIN jobs_job_skills jjs ON jjs.jobskill_id = r.id
+                        WHERE r.name IS DISTINCT FROM p.name
+                    )
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+
+
+            /*
+            ---------------------------------------------------------
+            5. Triggers
+            ---------------------------------------------------------
+            */
+            CREATE TRIGGER job_search_vector_before_insert
+            BEFORE INSERT
+            ON jobs_job
+            FOR EACH ROW
+            EXECUTE FUNCTION job_before_save_search_vector();
+
+            CREATE TRIGGER job_search_vector_before_update
+            BEFORE UPDATE OF title, requirements, description
+            ON jobs_job
+            FOR EACH ROW
+            WHEN (
+                OLD.title IS DISTINCT FROM NEW.title OR
+                OLD.requirements IS DISTINCT FROM NEW.requirements OR
+                OLD.description IS DISTINCT FROM NEW.description
+            )
+            EXECUTE FUNCTION job_before_save_search_vector();
+
+            CREATE TRIGGER job_search_vector_after_skills_insert
+            AFTER INSERT
+            ON jobs_job_skills
+            REFERENCING NEW TABLE AS inserted_job_skills
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION job_skills_after_insert();
+
+            CREATE TRIGGER job_search_vector_after_skills_delete
+            AFTER DELETE
+            ON jobs_job_skills
+            REFERENCING OLD TABLE AS deleted_job_skills
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION job_skills_after_delete();
+
+            CREATE TRIGGER job_search_vector_after_skill_rename
+            AFTER UPDATE
+            ON jobs_jobskill
+            REFERENCING OLD TABLE AS previous_skills NEW TABLE AS renamed_skills
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION job_skill_after_rename();
+            """,
+
+            # ======================= REVERSE =======================
+            """
+            DROP TRIGGER IF EXISTS job_search_vector_after_skill_rename ON jobs_jobskill;
+            DROP TRIGGER IF EXISTS job_search_vector_after_skills_delete ON jobs_job_skills;
+            DROP TRIGGER IF EXISTS job_search_vector_after_skills_insert ON jobs_job_skills;
+            DROP TRIGGER IF EXISTS job_search_vector_before_update ON jobs_job;
+            DROP TRIGGER IF EXISTS job_search_vector_before_insert ON jobs_job;
+
+            DROP FUNCTION IF EXISTS job_skill_after_rename();
+            DROP FUNCTION IF EXISTS job_skills_after_delete();
+            DROP FUNCTION IF EXISTS job_skills_after_insert();
+            DROP FUNCTION IF EXISTS job_before_save_search_vector();
+            DROP FUNCTION IF EXISTS refresh_job_search_vectors(BIGINT[]);
+            DROP FUNCTION IF EXISTS job_skill_names(BIGINT);
+            DROP FUNCTION IF EXISTS build_job_search_vector(TEXT, TEXT, TEXT, TEXT);
+            """
+            + PREVIOUS_TRIGGERS_SQL
+        )
+    ]
@@ -122,6 +122,12 @@ class Job(models.Model):
                 fields=["title"],
                 opclasses=["gist_trgm_ops"]
             ),
+            # Public feed order; keyset pages are range scans on this.
+            models.Index(
+                name="job_public_feed_idx",
+                fields=["-published_at", "-id"],
+                condition=models.Q(status="published", is_active=True),
+            ),
         ]
 
     def __str__(self):
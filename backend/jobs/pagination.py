@@ -1,4 +1,14 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class RecruiterJobPagination(PageNumberPagination):
@@ -10,3 +20,230 @@ class Pagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return parse_datetime(value["dt"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination on the queryset's own ORDER BY, with the primary key
+    appended as a tiebreaker. The cursor holds the sort values of the last
+    (or first) row served and the next page filters on the tuple beyond
+    it, so every page is an index range scan rather than an OFFSET. No
+    count is run unless `count_query_param` is passed.
+
+    Order-by entries must be plain field or annotation names. Nulls sort
+    as Postgres does by default: last ascending, first descending.
+    """
+
+    page_size = 12
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        values, reverse = self.decode_cursor(request)
+        self.has_cursor = values is not None
+
+        self.count = None
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            self.count = queryset.order_by().count()
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [self.flip(field) for field in ordering]
+
+        if self.has_cursor:
+            queryset = queryset.filter(self.after(ordering, values))
+
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+
+        for field in ordering:
+            if not isinstance(field, str):
+                raise TypeError(f"{type(self).__name__} needs field names to order by, got {field!r}")
+
+        pk = queryset.model._meta.pk.name
+        if not any(field.lstrip("-") in (pk, "pk") for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{pk}" if descending else pk)
+
+        return ordering
+
+    @staticmethod
+    def flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def after(ordering, values):
+        """
+        Rows strictly beyond `values` in `ordering`, as
+        (a > x) OR (a = x AND b > y) OR ... with NULL treated as the
+        largest value.
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            descending = field.startswith("-")
+
+            if value is None:
+                # Nothing is beyond NULL ascending; everything non-null is
+                # beyond it descending.
+                beyond = Q(**{f"{name}__isnull": False}) if descending else Q(pk__in=[])
+                same = Q(**{f"{name}__isnull": True})
+            else:
+                if descending:
+                    beyond = Q(**{f"{name}__lt": value})
+                else:
+                    beyond = Q(**{f"{name}__gt": value})
+                    if name not in ("id", "pk"):
+                        beyond |= Q(**{f"{name}__isnull": True})
+                same = Q(**{name: value})
+
+            condition |= equal & beyond
+            equal &= same
+
+        # Redundant bound on the leading key so the planner starts the
+        # index scan at the cursor instead of filtering from the top.
+        name, value = ordering[0].lstrip("-"), values[0]
+        if value is not None:
+            if ordering[0].startswith("-"):
+                condition &= Q(**{f"{name}__lte": value})
+            else:
+                condition &= Q(**{f"{name}__gte": value}) | Q(**{f"{name}__isnull": True})
+
+        return condition
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = [_decode_value(value) for value in payload["v"]]
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if len(values) != len(self.ordering):
+            # Ordering changed since the cursor was issued.
+            raise NotFound(self.invalid_cursor_message)
+
+        return values, reverse
+
+    def encode_cursor(self, row, reverse):
+        values = [
+            _encode_value(getattr(row, field.lstrip("-")))
+            for field in self.ordering
+        ]
+        payload = json.dumps({"v": values, "r": reverse}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            # An emptied reverse page: restart from the top.
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        body = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            body = {"count": self.count, **body}
+        return Response(body)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class PublicJobPagination(RecruiterJobPagination):
+    """
+    Page numbers by default. `?pagination=cursor` (or any request carrying
+    a cursor) switches to keyset pagination, which skips the COUNT and
+    keeps deep pages as cheap as the first.
+    """
+
+    keyset_class = KeysetPagination
+
+    def use_keyset(self, request):
+        return (
+            request.query_params.get("pagination") == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
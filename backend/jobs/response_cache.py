@@ -0,0 +1,152 @@
+import copy
+import hashlib
+import logging
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+from rest_framework import status
+from rest_framework.response import Response
+
+from applications.models import JobApplication
+from jobs.models.job import SavedJob
+
+logger = logging.getLogger(__name__)
+
+
+GENERATION_KEY = "response:generation:{scope}"
+RESPONSE_KEY = "response:{view}:{generations}:{digest}"
+
+# Fields computed per jobseeker; cached bodies hold them as False.
+USER_FIELDS = ("has_applied", "is_saved")
+
+
+def bump_generation(scope):
+    """
+    Invalidates every cached response depending on `scope` ("jobs" or
+    "recruiters") by moving its generation on: one INCR, no key scans.
+    Old entries are left to expire.
+    """
+    key = GENERATION_KEY.format(scope=scope)
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, timeout=None)
+    except RedisError:
+        logger.exception(f"Response cache unavailable | scope={scope}")
+
+
+def response_cache_key(request, view_name, scopes):
+    generations = cache.get_many([GENERATION_KEY.format(scope=scope) for scope in scopes])
+    versions = ".".join(
+        str(generations.get(GENERATION_KEY.format(scope=scope), 0)) for scope in scopes
+    )
+
+    params = sorted(
+        (key, value.strip())
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+        if value.strip()
+    )
+    raw = f"{request.get_host()}{request.path}?{urlencode(params)}"
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    return RESPONSE_KEY.format(view=view_name, generations=versions, digest=digest)
+
+
+def _items(body):
+    if isinstance(body, dict) and isinstance(body.get("results"), list):
+        return body["results"]
+    if isinstance(body, list):
+        return body
+    return [body] if isinstance(body, dict) else []
+
+
+def strip_user_fields(body):
+    body = copy.deepcopy(body)
+    for item in _items(body):
+        for field in USER_FIELDS:
+            if field in item:
+                item[field] = False
+    return body
+
+
+def overlay_user_fields(request, body):
+    """
+    Fills has_applied / is_saved on a shared cached body for the
+    requesting jobseeker, with one query per field.
+    """
+    user = request.user
+    if not user.is_authenticated or getattr(user, "role", None) != "jobseeker":
+        return body
+
+    items = [
+        item for item in _items(body)
+        if "id" in item and any(field in item for field in USER_FIELDS)
+    ]
+    if not items:
+        return body
+
+    job_ids = [item["id"] for item in items]
+    applied = set(
+        JobApplication.objects.filter(
+            applicant=user.jobseeker_profile,
+            job_id__in=job_ids,
+        ).values_list("job_id", flat=True)
+    )
+    saved = set()
+    if any("is_saved" in item for item in items):
+        saved = set(
+            SavedJob.objects.filter(user=user, job_id__in=job_ids).values_list("job_id", flat=True)
+        )
+
+    for item in items:
+        if "has_applied" in item:
+            item["has_applied"] = item["id"] in applied
+        if "is_saved" in item:
+            item["is_saved"] = item["id"] in saved
+
+    return body
+
+
+class VersionedResponseCacheMixin:
+    """
+    Caches successful GET bodies in Redis keyed by the view, the
+    normalized query string and the generations of
+    `response_cache_scopes`, which signals bump whenever a Job or
+    RecruiterProfile is saved. Everyone shares one body; per-user fields
+    are overlaid for jobseekers. Fails open when Redis is down.
+    """
+
+    response_cache_scopes = ("jobs", "recruiters")
+
+    def get(self, request, *args, **kwargs):
+        if not self.response_cache_scopes:
+            return super().get(request, *args, **kwargs)
+
+        try:
+            key = response_cache_key(request, type(self).__name__, self.response_cache_scopes)
+            body = cache.get(key)
+        except RedisError:
+            logger.exception("Response cache unavailable")
+            return super().get(request, *args, **kwargs)
+
+        if body is not None:
+            self.response_cache_hit(request, *args, **kwargs)
+            body = overlay_user_fields(request, body)
+            return Response(body, status=status.HTTP_200_OK)
+
+        response = super().get(request, *args, **kwargs)
+
+        if response.status_code == status.HTTP_200_OK:
+            try:
+                cache.set(key, strip_user_fields(response.data), settings.RESPONSE_CACHE_TTL)
+            except RedisError:
+                logger.exception("Response cache unavailable")
+
+        return response
+
+    def response_cache_hit(self, request, *args, **kwargs):
+        """Side effects the uncached view would have run."""
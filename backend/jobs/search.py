@@ -0,0 +1,128 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Q, When
+from pgvector.django import CosineDistance
+
+from embeddings.models import JobEmbedding
+from embeddings.vector_search import vector_search_profile
+
+logger = logging.getLogger(__name__)
+
+
+def lexical_candidates(queryset, search):
+    """
+    Phase one of lexical search: ids of the jobs in `queryset` matching
+    `search` through index-usable operators only (GIN @@ on
+    search_vector, GiST % on title). Nothing is ranked here.
+    """
+    query = SearchQuery(search, search_type="websearch")
+    return (
+        queryset.order_by()
+        .filter(Q(search_vector=query) | Q(title__trigram_similar=search))
+        .values("id")
+    )
+
+
+def lexical_search(queryset, search):
+    """
+    Restricts `queryset` to the lexical candidates for `search` and
+    annotates `rank` and `similarity` for those rows only, so the cost
+    follows the number of matches rather than the catalogue size.
+    """
+    query = SearchQuery(search, search_type="websearch")
+    return (
+        queryset.filter(id__in=lexical_candidates(queryset, search))
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            similarity=TrigramSimilarity("title", search),
+        )
+        .filter(Q(rank__gt=0.01) | Q(similarity__gt=0.2))
+    )
+
+
+def hybrid_ranked_job_ids(queryset, search, query_vector, limit=None):
+    """
+    Ranks the jobs of `queryset` for `search` by reciprocal rank fusion
+    of a lexical top-K (tsvector @@ / trigram %) and a semantic top-K
+    (JobEmbedding ANN), fetched in a single query. Returns ordered job ids.
+    """
+    limit = limit or settings.HYBRID_SEARCH_CANDIDATES
+    base_ids = queryset.order_by().values("id")
+
+    query = SearchQuery(search, search_type="websearch")
+    lexical = (
+        queryset.model.objects.filter(id__in=lexical_candidates(queryset, search))
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            similarity=TrigramSimilarity("title", search),
+        )
+        .order_by("-rank", "-similarity")
+        .values("id", "rank", "similarity")[:limit]
+    )
+
+    semantic = (
+        JobEmbedding.objects.filter(job_id__in=base_ids)
+        .annotate(distance=CosineDistance("embedding", query_vector))
+        .order_by("distance")
+        .values("job_id", "distance")[:limit]
+    )
+
+    lexical_sql, lexical_params = lexical.query.sql_with_params()
+    semantic_sql, semantic_params = semantic.query.sql_with_params()
+
+    sql = f"""
+        WITH lexical AS ({lexical_sql}),
+        semantic AS ({semantic_sql})
+        SELECT id, ROW_NUMBER() OVER (ORDER BY rank DESC, similarity DESC)
+        FROM lexical
+        UNION ALL
+        SELECT job_id, ROW_NUMBER() OVER (ORDER BY distance)
+        FROM semantic
+    """
+
+    with vector_search_profile("interactive"):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, (*lexical_params, *semantic_params))
+            job_ids = reciprocal_rank_fusion(cursor.fetchall())
+
+    logger.info(
+        "Hybrid search ranked",
+        extra={"candidates": len(job_ids), "limit": limit},
+    )
+
+    return job_ids
+
+
+def reciprocal_rank_fusion(rows, k=None):
+    """
+    Fuses (id, position) rows from several rankings into one order. An
+    id scores the sum of 1 / (k + position) over the rankings it appears
+    in; ties go to the higher (newer) id.
+    """
+    k = settings.HYBRID_SEARCH_RRF_K if k is None else k
+
+    scores = defaultdict(float)
+    for object_id, position in rows:
+        scores[object_id] += 1.0 / (k + position)
+
+    return sorted(scores, key=lambda object_id: (scores[object_id], object_id), reverse=True)
+
+
+def order_by_ids(queryset, ids):
+    """
+    Restricts `queryset` to `ids`, preserving their order. The order is
+    annotated as `search_position` so cursor pagination can key on it.
+    """
+    position = Case(
+        *[When(id=pk, then=index) for index, pk in enumerate(ids)],
+        output_field=IntegerField(),
+    )
+    return (
+        queryset.filter(id__in=ids)
+        .annotate(search_position=position)
+        .order_by("search_position")
+    )
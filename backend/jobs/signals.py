@@ -1,10 +1,12 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
 
 from jobs.models.job import Job
+from jobs.response_cache import bump_generation
+from recruiter.models import RecruiterProfile
 from .usecases import notify_admins_new_job
 
 logger = logging.getLogger(__name__)
@@ -15,3 +17,16 @@ def notify_new_job_signal(sender, instance, created, **kwargs):
         return
 
     transaction.on_commit(lambda: notify_admins_new_job(instance))
+
+
+@receiver(post_save, sender=Job, dispatch_uid="bump_job_response_generation")
+@receiver(post_delete, sender=Job, dispatch_uid="bump_job_response_generation_delete")
+@receiver(m2m_changed, sender=Job.skills.through, dispatch_uid="bump_job_response_generation_skills")
+def bump_job_response_generation(sender, **kwargs):
+    transaction.on_commit(lambda: bump_generation("jobs"))
+
+
+@receiver(post_save, sender=RecruiterProfile, dispatch_uid="bump_recruiter_response_generation")
+@receiver(post_delete, sender=RecruiterProfile, dispatch_uid="bump_recruiter_response_generation_delete")
+def bump_recruiter_response_generation(sender, **kwargs):
+    transaction.on_commit(lambda: bump_generation("recruiters"))
@@ -6,6 +6,7 @@ from django.db.models import Q
 
 
 from jobs.models.job import Job
+from jobs.response_cache import bump_generation
 from notifications.services import bulk_create_notifications
 from notifications.choices import TypeChoices, RoleChoices
 
@@ -45,6 +46,10 @@ def expire_jobs(self):
 
     logger.info("Expired %s jobs", updated)
 
+    # Bulk update: no post_save to invalidate cached public pages.
+    if updated:
+        bump_generation("jobs")
+
     notification_data = [
         {
             "user": job.recruiter.user,
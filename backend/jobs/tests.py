@@ -1,3 +1,316 @@
-from django.test import TestCase
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from jobs.facets import facet_cache_key, job_facets
+from jobs.models.job import Job
+from jobs.pagination import KeysetPagination
+from jobs.response_cache import (
+    VersionedResponseCacheMixin,
+    bump_generation,
+    response_cache_key,
+)
+from jobs.search import hybrid_ranked_job_ids, reciprocal_rank_fusion
+from jobs.views.public import JobResumeSimilarityView, LandingPageStatsView
+
+
+factory = APIRequestFactory()
+
+
+def cursor_request(cursor):
+    return Request(factory.get("/api/jobs/public/", {"cursor": cursor}))
+
+
+def mock_connection(rows):
+    cursor = mock.MagicMock()
+    cursor.fetchall.return_value = rows
+    connection = mock.MagicMock()
+    connection.cursor.return_value.__enter__.return_value = cursor
+    return connection
+
+
+class KeysetCursorTests(SimpleTestCase):
+    def setUp(self):
+        self.paginator = KeysetPagination()
+        self.paginator.ordering = ["-published_at", "-salary_sort", "-id"]
+        self.paginator.base_url = "http://testserver/api/jobs/public/?pagination=cursor"
+
+    def cursor_from(self, link):
+        return parse_qs(urlparse(link).query)["cursor"][0]
+
+    def test_cursor_round_trip(self):
+        row = SimpleNamespace(
+            published_at=datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+            salary_sort=Decimal("1200000.50"),
+            id=42,
+        )
+
+        for reverse in (False, True):
+            link = self.paginator.encode_cursor(row, reverse=reverse)
+            values, decoded_reverse = self.paginator.decode_cursor(
+                cursor_request(self.cursor_from(link))
+            )
+
+            self.assertEqual(values, [row.published_at, row.salary_sort, row.id])
+            self.assertEqual(decoded_reverse, reverse)
+
+    def test_cursor_keeps_nulls_and_other_params(self):
+        row = SimpleNamespace(published_at=None, salary_sort=Decimal("0"), id=7)
+
+        link = self.paginator.encode_cursor(row, reverse=False)
+        values, _ = self.paginator.decode_cursor(cursor_request(self.cursor_from(link)))
+
+        self.assertEqual(values, [None, Decimal("0"), 7])
+        self.assertEqual(parse_qs(urlparse(link).query)["pagination"], ["cursor"])
+
+    def test_garbled_cursor_is_not_found(self):
+        with self.assertRaises(NotFound):
+            self.paginator.decode_cursor(cursor_request("not-a-cursor"))
+
+    def test_cursor_from_another_ordering_is_not_found(self):
+        row = SimpleNamespace(published_at=None, id=7)
+        other = KeysetPagination()
+        other.ordering = ["-published_at", "-id"]
+        other.base_url = self.paginator.base_url
+
+        link = other.encode_cursor(row, reverse=False)
+
+        with self.assertRaises(NotFound):
+            self.paginator.decode_cursor(cursor_request(self.cursor_from(link)))
+
+    def test_after_bounds_the_leading_key(self):
+        published_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        condition = KeysetPagination.after(["-published_at", "-id"], [published_at, 42])
+
+        sql = str(Job.objects.filter(condition).values("id").query)
+
+        self.assertIn('"jobs_job"."published_at" < 2026-03-01', sql)
+        self.assertIn('"jobs_job"."id" < 42', sql)
+        self.assertIn('"jobs_job"."published_at" <= 2026-03-01', sql)
+
+
+class ReciprocalRankFusionTests(SimpleTestCase):
+    def test_ranked_by_both_beats_first_in_one(self):
+        lexical = [(1, 1), (2, 2), (3, 3)]
+        semantic = [(4, 1), (2, 2), (3, 3)]
+
+        self.assertEqual(reciprocal_rank_fusion(lexical + semantic, k=60), [2, 3, 4, 1])
+
+    def test_small_k_favours_top_positions(self):
+        rows = [(1, 1), (2, 3), (2, 3)]
+
+        self.assertEqual(reciprocal_rank_fusion(rows, k=0), [1, 2])
+        self.assertEqual(reciprocal_rank_fusion(rows, k=60), [2, 1])
+
+    def test_ties_go_to_the_newer_job(self):
+        rows = [(5, 1), (9, 1)]
+
+        self.assertEqual(reciprocal_rank_fusion(rows, k=60), [9, 5])
+
+    def test_empty_rankings(self):
+        self.assertEqual(reciprocal_rank_fusion([], k=60), [])
+
+    @override_settings(HYBRID_SEARCH_RRF_K=60)
+    def test_hybrid_ranking_fuses_query_rows(self):
+        connection = mock_connection([(10, 1), (11, 2), (11, 1), (12, 2)])
+
+        with mock.patch("jobs.search.connection", connection), \
+                mock.patch("jobs.search.vector_search_profile", return_value=nullcontext()):
+            job_ids = hybrid_ranked_job_ids(Job.objects.all(), "python", [0.1] * 1536, limit=2)
+
+        self.assertEqual(job_ids, [11, 10, 12])
+        cursor = connection.cursor.return_value.__enter__.return_value
+        sql = cursor.execute.call_args.args[0]
+        self.assertIn("UNION ALL", sql)
+
+
+class JobFacetTests(SimpleTestCase):
+    rows = [
+        ("job_type", "full_time", 7),
+        ("job_type", "internship", 2),
+        ("job_type", None, 0),
+        ("work_mode", "remote", 4),
+        ("work_mode", "onsite", 5),
+        ("location_city", "Pune", 3),
+        ("location_city", "Delhi", 3),
+        ("location_city", "Mumbai", 6),
+        ("salary", "20L+", 1),
+        ("salary", "0-3L", 2),
+        ("salary", "6-10L", 4),
+        ("skills", "Python", 8),
+        ("skills", "Django", 5),
+        ("skills", "SQL", 1),
+        ("skills", None, 3),
+    ]
+
+    def facets(self, top=10):
+        with mock.patch("jobs.facets.connection", mock_connection(self.rows)):
+            return job_facets(Job.objects.all(), top=top)
+
+    def test_counts_grouped_and_sorted(self):
+        facets = self.facets()
+
+        self.assertEqual(
+            facets["job_type"],
+            [{"value": "full_time", "count": 7}, {"value": "internship", "count": 2}],
+        )
+        self.assertEqual(
+            facets["work_mode"],
+            [{"value": "onsite", "count": 5}, {"value": "remote", "count": 4}],
+        )
+        self.assertEqual(
+            [item["value"] for item in facets["location_city"]],
+            ["Mumbai", "Delhi", "Pune"],
+        )
+        self.assertEqual(facets["experience_level"], [])
+
+    def test_null_values_dropped(self):
+        facets = self.facets()
+
+        self.assertEqual([item["value"] for item in facets["skills"]], ["Python", "Django", "SQL"])
+
+    def test_cities_and_skills_cut_to_top(self):
+        facets = self.facets(top=2)
+
+        self.assertEqual([item["value"] for item in facets["location_city"]], ["Mumbai", "Delhi"])
+        self.assertEqual([item["value"] for item in facets["skills"]], ["Python", "Django"])
+        self.assertEqual(len(facets["job_type"]), 2)
+
+    def test_salary_buckets_in_range_order_with_bounds(self):
+        facets = self.facets()
+
+        self.assertEqual(
+            facets["salary"],
+            [
+                {"value": "0-3L", "count": 2, "min": 0, "max": 300_000},
+                {"value": "6-10L", "count": 4, "min": 600_000, "max": 1_000_000},
+                {"value": "20L+", "count": 1, "min": 2_000_000, "max": None},
+            ],
+        )
+
+    def test_cache_key_ignores_paging_order_and_mode(self):
+        key = facet_cache_key(QueryDict("search=python&job_type=full_time"))
+
+        self.assertEqual(
+            facet_cache_key(QueryDict("job_type=full_time&page=3&mode=hybrid&search=python&ordering=-published_at")),
+            key,
+        )
+        self.assertNotEqual(facet_cache_key(QueryDict("search=python&job_type=internship")), key)
+
+
+class CountingListView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+
+    def get(self, request):
+        CountingListView.calls += 1
+        return Response({"results": [{"id": 1, "title": "Backend engineer", "has_applied": True}]})
+
+
+class CachedListView(VersionedResponseCacheMixin, CountingListView):
+    response_cache_scopes = ("jobs",)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    RESPONSE_CACHE_TTL=60,
+)
+class ResponseCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        CountingListView.calls = 0
+        self.view = CachedListView.as_view()
+
+    def key(self, path="/api/jobs/public/?search=python&page=2", scopes=("jobs", "recruiters")):
+        return response_cache_key(Request(factory.get(path)), "PublicJobListView", scopes)
+
+    def test_bump_moves_only_its_scope(self):
+        key = self.key()
+
+        bump_generation("jobs")
+        jobs_bumped = self.key()
+        self.assertNotEqual(jobs_bumped, key)
+
+        bump_generation("recruiters")
+        self.assertNotEqual(self.key(), jobs_bumped)
+        self.assertEqual(self.key(scopes=("jobs",)), self.key(scopes=("jobs",)))
+
+    def test_generation_counts_up_from_missing(self):
+        bump_generation("jobs")
+        bump_generation("jobs")
+
+        self.assertIn(":2:", self.key(scopes=("jobs",)))
+
+    def test_key_ignores_param_order_and_blanks(self):
+        self.assertEqual(
+            self.key("/api/jobs/public/?page=2&search=python&job_type="),
+            self.key(),
+        )
+
+    def test_hit_until_generation_bumped(self):
+        first = self.view(factory.get("/api/jobs/public/"))
+        second = self.view(factory.get("/api/jobs/public/"))
+
+        self.assertEqual(CountingListView.calls, 1)
+        self.assertEqual(second.data["results"][0]["title"], first.data["results"][0]["title"])
+
+        bump_generation("jobs")
+        self.view(factory.get("/api/jobs/public/"))
+
+        self.assertEqual(CountingListView.calls, 2)
+
+    def test_cached_body_has_user_fields_cleared(self):
+        self.view(factory.get("/api/jobs/public/"))
+        cached = self.view(factory.get("/api/jobs/public/"))
+
+        self.assertIs(cached.data["results"][0]["has_applied"], False)
+
+    def test_landing_stats_cached_until_recruiters_bumped(self):
+        view = LandingPageStatsView.as_view()
+        recruiters = [{"id": 3, "company_name": "Acme", "location": "Pune", "logo": None, "job_count": 4}]
+
+        with mock.patch.object(LandingPageStatsView, "get_queryset", return_value=recruiters) as queryset:
+            first = view(factory.get("/api/jobs/landing-stats/"))
+            second = view(factory.get("/api/jobs/landing-stats/"))
+
+            self.assertEqual(queryset.call_count, 1)
+            self.assertEqual(second.data, first.data)
+            self.assertEqual(first.data[0]["company_name"], "Acme")
+
+            bump_generation("recruiters")
+            view(factory.get("/api/jobs/landing-stats/"))
+
+            self.assertEqual(queryset.call_count, 2)
+
+
+class JobResumeSimilarityValidationTests(SimpleTestCase):
+    def post(self, data):
+        request = factory.post("/api/jobs/similarity/", data, format="json")
+        return JobResumeSimilarityView.as_view()(request)
+
+    def test_non_numeric_ids_rejected(self):
+        response = self.post({"user_id": "abc", "job_id": "12x"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("user_id", response.data)
+        self.assertIn("job_id", response.data)
+
+    def test_missing_and_non_positive_ids_rejected(self):
+        response = self.post({"user_id": 0})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("user_id", response.data)
+        self.assertIn("job_id", response.data)
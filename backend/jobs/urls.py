@@ -8,6 +8,7 @@ from jobs.views.recruiter import (
 )
 from jobs.views.public import (
     PublicJobListView,
+    PublicJobFacetsView,
     PublicJobDetailView,
     PublicSavedJobsListView,
     SaveJobView,
@@ -71,6 +72,12 @@ urlpatterns = [
         name="public-job-list"
     ),
 
+    path(
+        "jobs/public/facets/",
+        PublicJobFacetsView.as_view(),
+        name="public-job-facets"
+    ),
+
     path(
         "jobs/public/<int:pk>/",
         PublicJobDetailView.as_view(),
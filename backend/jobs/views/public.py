@@ -1,10 +1,5 @@
 import logging
 
-from django.contrib.postgres.search import (
-    SearchQuery,
-    SearchRank,
-    TrigramSimilarity,
-)
 from django.db.models import (
     BooleanField,
     Count,
@@ -12,11 +7,11 @@ from django.db.models import (
     F,
     FloatField,
     OuterRef,
-    Q,
     Value,
 )
 from django.db.models import ExpressionWrapper
 from django.db.models.functions import Coalesce
+from django.conf import settings
 from django.utils import timezone
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -29,9 +24,11 @@ from rest_framework.filters import OrderingFilter
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 
 from applications.models import JobApplication
+from jobs.facets import facet_cache_key, get_cached_facets, job_facets, store_facets
 from jobs.filters import PublicJobFilter
 from jobs.models.job import Job, SavedJob
-from jobs.pagination import RecruiterJobPagination, Pagination
+from jobs.pagination import Pagination, PublicJobPagination
+from jobs.response_cache import VersionedResponseCacheMixin
 from jobs.serializers import (
     PublicJobDetailSerializer,
     PublicJobListSerializer,
@@ -42,8 +39,12 @@ from jobs.serializers import (
 from core.permissions import IsJobseeker
 from django.db import IntegrityError
 from recruiter.models import RecruiterProfile
-from embeddings.models import JobEmbedding, ResumeEmbedding, JobResumeInsight
-from embeddings.services import generate_application_insight
+from embeddings.matrix import job_embedding_matrix
+from embeddings.models import JobEmbedding, ResumeEmbedding
+from embeddings.query_cache import get_query_embedding
+from embeddings.insights import get_current_insight
+from embeddings.tasks import schedule_job_resume_insight
+from jobs.search import hybrid_ranked_job_ids, lexical_search, order_by_ids
 from profiles.models import JobSeekerResume
 from subscriptions.models import UserSubscription
 from pgvector.django import CosineDistance
@@ -51,9 +52,9 @@ from pgvector.django import CosineDistance
 logger = logging.getLogger(__name__)
 
 
-class PublicJobListView(ListAPIView):
+class PublicJobListView(VersionedResponseCacheMixin, ListAPIView):
     serializer_class = PublicJobListSerializer
-    pagination_class = RecruiterJobPagination
+    pagination_class = PublicJobPagination
 
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = PublicJobFilter
@@ -62,7 +63,14 @@ class PublicJobListView(ListAPIView):
         "published_at",
         "salary_sort",
     ]
-    ordering = ["-published_at"]
+
+    @property
+    def ordering(self):
+        # Default for OrderingFilter: relevance when searching lexically
+        # (hybrid search orders by its own ranking), else newest first.
+        if self.request.query_params.get("search") and not self.is_hybrid_search():
+            return ["-rank", "-similarity", "-published_at"]
+        return ["-published_at"]
 
     def get_queryset(self):
         ordering_param = self.request.query_params.get("ordering")
@@ -85,22 +93,8 @@ class PublicJobListView(ListAPIView):
             salary_sort=Coalesce("salary_max", "salary_min", 0)
         )
 
-        if search:
-            query = SearchQuery(search, search_type="websearch")
-
-            queryset = queryset.annotate(
-                rank=SearchRank("search_vector", query),
-                similarity=TrigramSimilarity("title", search),
-            ).filter(
-                Q(rank__gt=0.01) | Q(similarity__gt=0.2)
-            )
-
-            if not ordering_param:
-                queryset = queryset.order_by(
-                    "-rank",
-                    "-similarity",
-                    "-published_at",
-                )
+        if search and not self.is_hybrid_search():
+            queryset = self.lexical_search(queryset, search)
 
         if user.is_authenticated and getattr(user, "role", None) == "jobseeker":
             queryset = queryset.annotate(
@@ -118,6 +112,74 @@ class PublicJobListView(ListAPIView):
 
         return queryset
 
+    def lexical_search(self, queryset, search):
+        queryset = lexical_search(queryset, search)
+
+        if not self.request.query_params.get("ordering"):
+            queryset = queryset.order_by(
+                "-rank",
+                "-similarity",
+                "-published_at",
+            )
+
+        return queryset
+
+    def is_hybrid_search(self):
+        return (
+            bool(self.request.query_params.get("search"))
+            and self.request.query_params.get("mode") == "hybrid"
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if not self.is_hybrid_search():
+            return queryset
+
+        search = self.request.query_params.get("search")
+
+        try:
+            query_vector = get_query_embedding(search)
+        except Exception:
+            logger.exception("Hybrid search embedding failed, using lexical ranking")
+            query_vector = None
+
+        if query_vector is None:
+            return self.lexical_search(queryset, search)
+
+        job_ids = hybrid_ranked_job_ids(queryset, search, query_vector)
+        queryset = order_by_ids(queryset, job_ids)
+
+        if self.request.query_params.get("ordering"):
+            queryset = OrderingFilter().filter_queryset(self.request, queryset, self)
+
+        return queryset
+
+
+class PublicJobFacetsView(PublicJobListView):
+    """
+    Filter sidebar counts for the jobs the list view would return with
+    the same search and filters. Searches are always counted over the
+    lexical matches, so facets never wait on the embedding provider.
+    """
+
+    pagination_class = None
+    # Cached by filter key with its own TTL instead.
+    response_cache_scopes = ()
+
+    def is_hybrid_search(self):
+        return False
+
+    def list(self, request, *args, **kwargs):
+        key = facet_cache_key(request.query_params)
+        facets = get_cached_facets(key)
+
+        if facets is None:
+            facets = job_facets(self.filter_queryset(self.get_queryset()))
+            store_facets(key, facets)
+
+        return Response(facets, status=status.HTTP_200_OK)
+
 
 class JobBatchSimilarityRequestSerializer(serializers.Serializer):
     job_ids = serializers.ListField(
@@ -175,21 +237,32 @@ class JobResumeBatchSimilarityView(APIView):
                 status=status.HTTP_200_OK,
             )
 
-        embedding_rows = (
-            JobEmbedding.objects.filter(job_id__in=unique_job_ids)
-            .annotate(
-                similarity=ExpressionWrapper(
-                    1 - CosineDistance("embedding", default_resume_embedding.embedding),
-                    output_field=FloatField(),
+        resume_vector = default_resume_embedding.embedding
+
+        similarity_map = job_embedding_matrix.similarities(unique_job_ids, resume_vector)
+
+        # Jobs newer than the snapshot fall back to the database.
+        uncached_job_ids = [job_id for job_id in unique_job_ids if job_id not in similarity_map]
+        if uncached_job_ids:
+            embedding_rows = (
+                JobEmbedding.objects.filter(job_id__in=uncached_job_ids)
+                .annotate(
+                    similarity=ExpressionWrapper(
+                        1 - CosineDistance("embedding", resume_vector),
+                        output_field=FloatField(),
+                    )
                 )
+                .values("job_id", "similarity")
+            )
+            similarity_map.update(
+                (row["job_id"], row["similarity"])
+                for row in embedding_rows
+                if row.get("similarity") is not None
             )
-            .values("job_id", "similarity")
-        )
 
         score_map = {
-            row["job_id"]: round(float(row["similarity"]) * 100, 2)
-            for row in embedding_rows
-            if row.get("similarity") is not None
+            job_id: round(float(similarity) * 100, 2)
+            for job_id, similarity in similarity_map.items()
         }
 
         scores = [
@@ -212,7 +285,7 @@ class JobResumeBatchSimilarityView(APIView):
 
 
 
-class PublicJobDetailView(RetrieveAPIView):
+class PublicJobDetailView(VersionedResponseCacheMixin, RetrieveAPIView):
     serializer_class = PublicJobDetailSerializer
 
     def get_queryset(self):
@@ -276,6 +349,11 @@ class PublicJobDetailView(RetrieveAPIView):
 
         return job
 
+    def response_cache_hit(self, request, *args, **kwargs):
+        Job.objects.filter(id=kwargs["pk"]).update(
+            view_count=F("view_count") + 1
+        )
+
 
 
 class PublicSavedJobsListView(ListAPIView):
@@ -353,10 +431,12 @@ class UnsaveJobView(APIView):
 
 
 
-class LandingPageStatsView(APIView):
+class LandingPageStatsView(VersionedResponseCacheMixin, ListAPIView):
+    serializer_class = TopRecruiterStatsSerializer
+    pagination_class = None
 
-    def get(self, request):
-        top_recruiters = (
+    def get_queryset(self):
+        return (
             RecruiterProfile.objects.exclude(status="pending")
             .annotate(job_count=Count("jobs"))
             .values(
@@ -370,31 +450,19 @@ class LandingPageStatsView(APIView):
         )
 
 
-
-        serializer = TopRecruiterStatsSerializer(top_recruiters, many=True)
-
-        return Response(serializer.data, status=status.HTTP_200_OK)
+class JobSimilarityRequestSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField(min_value=1)
+    job_id = serializers.IntegerField(min_value=1)
 
 
 class JobResumeSimilarityView(APIView):
 
     def post(self, request):
-        user_id = request.data.get("user_id")
-        job_id = request.data.get("job_id")
-
-        if not user_id or not job_id:
-            return Response(
-                {"detail": "Both user_id and job_id are required."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        serializer = JobSimilarityRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        try:
-            job_embedding = JobEmbedding.objects.get(job_id=job_id)
-        except JobEmbedding.DoesNotExist:
-            return Response(
-                {"detail": "Job embedding not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        user_id = serializer.validated_data["user_id"]
+        job_id = serializer.validated_data["job_id"]
 
         resume_embedding = (
             ResumeEmbedding.objects.filter(
@@ -402,27 +470,49 @@ class JobResumeSimilarityView(APIView):
                 resume__is_default=True,
                 resume__is_deleted=False,
             )
-            .annotate(
-                similarity=ExpressionWrapper(
-                    1 - CosineDistance("embedding", job_embedding.embedding),
-                    output_field=FloatField(),
-                )
-            )
+            .only("embedding")
             .first()
         )
 
-        if not resume_embedding:
-            return Response(
-                {"detail": "Default resume embedding not found for this user."},
-                status=status.HTTP_404_NOT_FOUND,
+        similarity = None
+        if resume_embedding:
+            similarity = job_embedding_matrix.similarities(
+                [job_id], resume_embedding.embedding
+            ).get(job_id)
+
+        if similarity is None:
+            try:
+                job_embedding = JobEmbedding.objects.get(job_id=job_id)
+            except JobEmbedding.DoesNotExist:
+                return Response(
+                    {"detail": "Job embedding not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            if not resume_embedding:
+                return Response(
+                    {"detail": "Default resume embedding not found for this user."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            similarity = (
+                ResumeEmbedding.objects.filter(pk=resume_embedding.pk)
+                .annotate(
+                    similarity=ExpressionWrapper(
+                        1 - CosineDistance("embedding", job_embedding.embedding),
+                        output_field=FloatField(),
+                    )
+                )
+                .values_list("similarity", flat=True)
+                .first()
             )
 
-        similarity = float(resume_embedding.similarity)
+        similarity = float(similarity)
 
         return Response(
             {
-                "user_id": int(user_id),
-                "job_id": int(job_id),
+                "user_id": user_id,
+                "job_id": job_id,
                 "cosine_similarity": round(similarity, 6),
                 "match_percent": round(similarity * 100, 2),
             },
@@ -481,10 +571,7 @@ class JobResumeInsightView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        cached = JobResumeInsight.objects.filter(
-            job=job,
-            resume=resume,
-        ).first()
+        cached = get_current_insight(job, resume)
 
         if cached:
             return Response(
@@ -492,6 +579,7 @@ class JobResumeInsightView(APIView):
                     "job_id": job.id,
                     "resume_id": resume.id,
                     "cached": True,
+                    "status": "ready",
                     "insight": {
                         "strengths": cached.strengths,
                         "gaps": cached.gaps,
@@ -501,49 +589,22 @@ class JobResumeInsightView(APIView):
                 status=status.HTTP_200_OK,
             )
 
-        resume_data = resume.parsed_data or {}
-        if not resume_data:
+        if not resume.parsed_data:
             return Response(
                 {"detail": "Default resume must be parsed before generating insight."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            insight = generate_application_insight(job, resume_data)
-        except Exception as exc:
-            logger.exception(
-                "Failed to generate AI insight",
-                extra={"job_id": job.id, "resume_id": resume.id, "user_id": user.id},
-            )
-            return Response(
-                {"detail": "Unable to generate insight right now."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        strengths = insight.get("strengths", [])
-        gaps = insight.get("gaps", [])
-        summary = insight.get("summary", "")
-
-        record, _ = JobResumeInsight.objects.update_or_create(
-            job=job,
-            resume=resume,
-            defaults={
-                "strengths": strengths,
-                "gaps": gaps,
-                "summary": summary,
-            },
-        )
+        schedule_job_resume_insight(job.id, resume.id)
 
         return Response(
             {
                 "job_id": job.id,
                 "resume_id": resume.id,
                 "cached": False,
-                "insight": {
-                    "strengths": record.strengths,
-                    "gaps": record.gaps,
-                    "summary": record.summary,
-                },
+                "status": "pending",
+                "insight": None,
             },
-            status=status.HTTP_200_OK,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After": str(settings.INSIGHT_POLL_AFTER)},
         )
@@ -193,7 +193,7 @@ class RecruiterJobDeleteView(APIView):
 
         job.is_active = False
         job.status = Job.Status.CLOSED
-        job.save()
+        job.save(update_fields=["is_active", "status", "updated_at"])
 
         logger.info(
             "Recruiter job closed",
@@ -1,17 +1,41 @@
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.conf import settings
 
 
-def send_email(*, to, subject, text_body, html_body):
+def build_email(*, to, subject, text_body, html_body, connection=None):
 
     email = EmailMultiAlternatives(
         subject=subject,
         body=text_body,
         from_email=settings.DEFAULT_FROM_EMAIL,
         to=[to],
+        connection=connection,
     )
 
     if html_body:
         email.attach_alternative(html_body, "text/html")
 
+    return email
+
+
+def send_email(*, to, subject, text_body, html_body):
+
+    email = build_email(
+        to=to,
+        subject=subject,
+        text_body=text_body,
+        html_body=html_body,
+    )
+
     email.send(fail_silently=False)
+
+
+def send_emails(messages):
+    """
+    Sends prepared messages over a single SMTP connection.
+    """
+    if not messages:
+        return 0
+
+    with get_connection(fail_silently=False) as connection:
+        return connection.send_messages(messages)
@@ -1,4 +1,4 @@
-from notifications.emails.base import send_email
+from notifications.emails.base import build_email, send_email, send_emails
 from notifications.emails.renderer import render_email
 
 
@@ -18,3 +18,28 @@ def send_email_from_payload(payload):
         text_body=text_body,
         html_body=html_body,
     )
+
+
+def send_emails_from_payloads(payloads):
+    """
+    Sends several normalized email payloads over one connection.
+    """
+
+    messages = []
+
+    for payload in payloads:
+        text_body, html_body = render_email(
+            template_name=payload["template"],
+            context=payload["context"],
+        )
+
+        messages.append(
+            build_email(
+                to=payload["to"],
+                subject=payload["subject"],
+                text_body=text_body,
+                html_body=html_body,
+            )
+        )
+
+    return send_emails(messages)
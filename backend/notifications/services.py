@@ -7,6 +7,8 @@ REQUIRED_FIELDS = ["user", "title", "message", "type"]
 
 def validate_fields(data: dict):
     for field in REQUIRED_FIELDS:
+        if field == "user" and "user_id" in data:
+            continue
         if field not in data:
             raise ValueError(f"Missing required field: {field}")
 
@@ -7,6 +7,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.pagination import EstimatedCountPagination
 from core.permissions import IsNotBlocked
 
 from .models import Notification
@@ -16,6 +17,7 @@ from .serializers import NotificationSerializer
 class UserNotificationListAPIView(ListAPIView):
     permission_classes = [IsAuthenticated, IsNotBlocked]
     serializer_class = NotificationSerializer
+    pagination_class = EstimatedCountPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["type", "is_read"]
     search_fields = ["title", "message"]
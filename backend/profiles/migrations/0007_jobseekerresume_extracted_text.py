@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_jobseekerresume_file_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobseekerresume',
+            name='extracted_text',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -93,12 +93,15 @@ class JobSeekerResume(models.Model):
 
     title = models.CharField(max_length=255)
     file = CloudinaryField(resource_type='image', folder="talento-dev/resumes/")
+    file_hash = models.CharField(max_length=64, blank=True, default="", db_index=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(
         max_length=20,
         choices=Status.choices,
         default=Status.UPLOADED
     )
+    # Checkpoint between the extract and parse pipeline stages.
+    extracted_text = models.TextField(blank=True, null=True)
     parsed_data = models.JSONField(blank=True, null=True)
     parsing_error = models.TextField(blank=True, null=True)
     is_default = models.BooleanField(default=False)
@@ -4,6 +4,7 @@ from pathlib import Path
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from embeddings.resume_cache import compute_file_hash
 
 from .models import (
     JobSeekerProfile,
@@ -175,6 +176,7 @@ class JobSeekerResumeSerializer(serializers.ModelSerializer):
         # Auto set default resume if first one
         has_resume = JobSeekerResume.objects.filter(profile=profile).exists()
         validated_data["is_default"] = not has_resume
+        validated_data["file_hash"] = compute_file_hash(validated_data["file"])
 
         return JobSeekerResume.objects.create(**validated_data)
 
@@ -73,9 +73,18 @@ export const getJobResumeSimilarityBatch = async (jobIds = []) => {
   return res.data;
 };
 
+const INSIGHT_POLL_MS = 3000;
+const INSIGHT_MAX_POLLS = 20;
+
+// Insights are generated in the background; poll while the API reports "pending".
 export const getJobResumeInsight = async (jobId) => {
-  const res = await api.get(`/v1/jobs/jobs/public/${Number(jobId)}/insight/`);
-  return res.data;
+  for (let attempt = 0; ; attempt += 1) {
+    const res = await api.get(`/v1/jobs/jobs/public/${Number(jobId)}/insight/`);
+    if (res.data?.status !== "pending" || attempt >= INSIGHT_MAX_POLLS) {
+      return res.data;
+    }
+    await new Promise((resolve) => setTimeout(resolve, INSIGHT_POLL_MS));
+  }
 };
 
 
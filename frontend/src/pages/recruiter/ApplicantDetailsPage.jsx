@@ -129,19 +129,32 @@ useEffect(() => {
 useEffect(() => {
   if (!applicantId) return;
 
+  let cancelled = false;
+
+  // Insights are generated in the background; poll while "pending".
   const fetchInsight = async () => {
     try {
       setInsightLoading(true);
-      const res = await api.get(`/v1/applications/${applicantId}/insight/`);
-      setInsight(res.data);
+      for (let attempt = 0; attempt < 20 && !cancelled; attempt += 1) {
+        const res = await api.get(`/v1/applications/${applicantId}/insight/`);
+        if (res.data?.status !== "pending") {
+          if (!cancelled) setInsight(res.data);
+          break;
+        }
+        await new Promise((resolve) => setTimeout(resolve, 3000));
+      }
     } catch (err) {
       console.error("Failed to load insights", err);
     } finally {
-      setInsightLoading(false);
+      if (!cancelled) setInsightLoading(false);
     }
   };
 
   fetchInsight();
+
+  return () => {
+    cancelled = true;
+  };
 }, [applicantId]);
 
 